@@ -5,6 +5,7 @@ Handles environment variables, API keys, and model configuration.
 """
 
 import os
+import stat
 from pathlib import Path
 
 import yaml
@@ -26,6 +27,17 @@ GOOGLE_DRIVE_FOLDER_ID = os.getenv("GOOGLE_DRIVE_FOLDER_ID")
 # If set, analysis files will be saved here instead of uploading to Google Drive
 LOCAL_OUTPUT_DIR = os.getenv("LOCAL_OUTPUT_DIR")
 
+# Longest edge, in pixels, that note images are scaled down to before being
+# sent to the vision API; larger images only cost upload bytes and tokens
+_image_max_dim = os.getenv("TASKTRIAGE_IMAGE_MAX_DIM", "1568")
+# isdecimal(), unlike isdigit(), only accepts characters int() can parse
+if not _image_max_dim.strip().isdecimal() or int(_image_max_dim) == 0:
+    raise ValueError(
+        f"TASKTRIAGE_IMAGE_MAX_DIM must be a positive whole number of pixels "
+        f"(e.g. 1568), got {_image_max_dim!r}. Fix or remove it in your .env file."
+    )
+IMAGE_MAX_DIMENSION = int(_image_max_dim)
+
 # Validate that at least one source is configured
 if not EXTERNAL_INPUT_DIR and not LOCAL_INPUT_DIR and not (GOOGLE_OAUTH_CLIENT_ID and GOOGLE_OAUTH_CLIENT_SECRET and GOOGLE_DRIVE_FOLDER_ID):
     raise ValueError(
@@ -99,26 +111,47 @@ def fetch_api_key(api_key: str | None = None) -> str:
     return api_key
 
 
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """Stat a path, returning None instead of raising if it can't be read.
+
+    Args:
+        path: Filesystem path to stat
+
+    Returns:
+        The stat result, or None if the path doesn't exist or is inaccessible
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _is_directory(path: str) -> bool:
+    """Check that a path exists and is a directory using a single stat call."""
+    st = _stat_or_none(path)
+    return st is not None and stat.S_ISDIR(st.st_mode)
+
+
 def is_usb_available() -> bool:
     """Check if USB input directory is configured and accessible.
 
     Returns:
-        True if EXTERNAL_INPUT_DIR is set and the directory exists
+        True if EXTERNAL_INPUT_DIR is set and points to an existing directory
     """
     if not EXTERNAL_INPUT_DIR:
         return False
-    return Path(EXTERNAL_INPUT_DIR).exists()
+    return _is_directory(EXTERNAL_INPUT_DIR)
 
 
 def is_local_input_available() -> bool:
     """Check if local input directory is configured and accessible.
 
     Returns:
-        True if LOCAL_INPUT_DIR is set and the directory exists
+        True if LOCAL_INPUT_DIR is set and points to an existing directory
     """
     if not LOCAL_INPUT_DIR:
         return False
-    return Path(LOCAL_INPUT_DIR).exists()
+    return _is_directory(LOCAL_INPUT_DIR)
 
 
 def get_all_input_directories() -> list[Path]:
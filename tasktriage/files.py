@@ -5,20 +5,35 @@ Handles loading task notes, collecting analyses, and saving output files.
 Supports both local USB directory and Google Drive as sources.
 """
 
+import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from babel.dates import format_datetime
 from pathlib import Path
 
 from .config import get_active_source, get_all_input_directories, get_primary_input_directory
-from .gdrive import parse_filename_datetime
+from .gdrive import (
+    GoogleDriveClient,
+    VISUAL_MIME_TYPES,
+    extract_timestamp_from_filename,
+    parse_filename,
+    parse_filename_datetime,
+)
 from .image import extract_text_from_image, extract_text_from_pdf, VISUAL_EXTENSIONS
 
 # Supported text file extensions
-TEXT_EXTENSIONS = {".txt"}
+TEXT_EXTENSIONS = frozenset({".txt"})
 
 # All supported input file extensions (text + images + PDFs)
 ALL_EXTENSIONS = TEXT_EXTENSIONS | VISUAL_EXTENSIONS
 
+# Notes filename stem: YYYYMMDD_HHMMSS with an optional _Page_N suffix
+_TIMESTAMP_STEM_RE = re.compile(r"^(\d{8}_\d{6})(?:_Page_\d+)?$")
+
+# Files the pipeline writes next to the notes; never candidates for analysis
+_DERIVED_SUFFIXES = (".triaged.txt", ".raw_notes.txt")
+
 
 def _get_week_of_month(date: datetime) -> int:
     """Calculate which week of the month a date falls into (1-4).
@@ -39,10 +54,12 @@ def _get_week_of_month(date: datetime) -> int:
         return 4
 
 
+@lru_cache(maxsize=2048)
 def _extract_timestamp(filename: str) -> str | None:
     """Extract timestamp portion from a notes filename.
 
-    Handles filenames with optional page identifiers.
+    Handles filenames with optional page identifiers. Results are memoized
+    per filename, since each scan revisits the same names.
 
     Supported formats:
         - YYYYMMDD_HHMMSS.ext (e.g., 20251225_073454.txt)
@@ -54,17 +71,44 @@ def _extract_timestamp(filename: str) -> str | None:
     Returns:
         Timestamp string (YYYYMMDD_HHMMSS) or None if not found
     """
-    stem = Path(filename).stem
+    match = _TIMESTAMP_STEM_RE.match(Path(filename).stem)
+    return match.group(1) if match else None
+
 
-    # Handle page identifiers (e.g., 20251225_073454_Page_1)
-    if "_Page_" in stem:
-        stem = stem.split("_Page_")[0]
+def _timestamp_date(timestamp: str) -> datetime:
+    """Convert the YYYYMMDD prefix of a notes timestamp to a datetime.
 
-    # Validate it looks like a timestamp (15 chars: YYYYMMDD_HHMMSS)
-    if len(stem) == 15 and stem[8] == "_":
-        return stem
+    Slices the fixed-width fields directly rather than going through
+    strptime's format parsing, since this runs for every scanned file.
+
+    Args:
+        timestamp: Timestamp string (YYYYMMDD_HHMMSS)
 
-    return None
+    Returns:
+        Midnight on the timestamp's date
+
+    Raises:
+        ValueError: If the prefix is not a valid date.
+    """
+    return datetime(int(timestamp[:4]), int(timestamp[4:6]), int(timestamp[6:8]))
+
+
+def _list_file_names(directory: Path) -> frozenset[str]:
+    """List the names of regular files in a directory with a single scan.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Frozen set of file names, empty if the directory doesn't exist
+    """
+    # DirEntry.is_file() answers from the d_type returned by the scan itself,
+    # so regular files are listed without a stat call each
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
 
 
 def generate_timestamp():
@@ -151,17 +195,25 @@ def _load_task_notes_usb(notes_type: str = "daily", file_preference: str = "png"
         if not notes_dir.exists():
             continue  # Skip this directory if it doesn't exist
 
+        # Scan the notes and analysis directories once; existence checks below
+        # are set lookups instead of per-file stat calls
+        notes_names = _list_file_names(notes_dir)
+        if notes_type in ["daily", "weekly", "monthly", "annual"]:
+            analysis_dir = notes_dir / notes_type
+        else:
+            analysis_dir = notes_dir
+        analysis_names = _list_file_names(analysis_dir)
+
         # Find all files matching preference and sort by name (newest first based on timestamp)
-        all_files = []
-        for ext in search_extensions:
-            all_files.extend(notes_dir.glob(f"*{ext}"))
-        all_files = sorted(all_files, reverse=True)
+        # Triaged and raw-notes outputs are dropped by name before any path parsing
+        all_files = sorted(
+            (notes_dir / name for name in notes_names
+             if not name.endswith(_DERIVED_SUFFIXES)
+             and os.path.splitext(name)[1].lower() in search_extensions),
+            reverse=True,
+        )
 
         for notes_path in all_files:
-            # Skip files that are already triaged
-            if ".triaged." in notes_path.name:
-                continue
-
             # Extract timestamp from filename (handles page identifiers)
             timestamp = _extract_timestamp(notes_path.name)
             if not timestamp:
@@ -170,7 +222,7 @@ def _load_task_notes_usb(notes_type: str = "daily", file_preference: str = "png"
             # Check if this file already has an associated analysis file
             # Use appropriate date format based on analysis type
             try:
-                ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+                ts_date = _timestamp_date(timestamp)
                 if notes_type == "daily":
                     date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
                 elif notes_type == "weekly":
@@ -186,13 +238,10 @@ def _load_task_notes_usb(notes_type: str = "daily", file_preference: str = "png"
                 continue
             analysis_filename = f"{date_str}.triaged.txt"
             # Analysis files are in subdirectories, not at the same level as raw notes
-            if notes_type in ["daily", "weekly", "monthly", "annual"]:
-                analysis_path = notes_path.parent / notes_type / analysis_filename
-            else:
-                analysis_path = notes_dir / analysis_filename
+            analysis_path = analysis_dir / analysis_filename
 
             # Include file if: no analysis exists OR file was modified after analysis
-            if not analysis_path.exists() or _needs_reanalysis_usb(notes_path, analysis_path):
+            if analysis_filename not in analysis_names or _needs_reanalysis_usb(notes_path, analysis_path):
                 # Parse datetime from the extracted timestamp
                 file_date = parse_filename_datetime(notes_path.name)
                 if not file_date:
@@ -202,9 +251,9 @@ def _load_task_notes_usb(notes_type: str = "daily", file_preference: str = "png"
                 suffix = notes_path.suffix.lower()
                 if suffix in VISUAL_EXTENSIONS:
                     # Visual files require .raw_notes.txt from Sync - skip if not converted
-                    raw_notes_path = notes_path.parent / f"{timestamp}.raw_notes.txt"
-                    if raw_notes_path.exists():
-                        file_contents = raw_notes_path.read_text()
+                    raw_notes_filename = f"{timestamp}.raw_notes.txt"
+                    if raw_notes_filename in notes_names:
+                        file_contents = (notes_dir / raw_notes_filename).read_text()
                     else:
                         # Skip this file - needs to be synced/converted first
                         continue
@@ -258,17 +307,25 @@ def _load_all_unanalyzed_task_notes_usb(notes_type: str = "daily", file_preferen
         if not notes_dir.exists():
             continue  # Skip this directory if it doesn't exist
 
+        # Scan the notes and analysis directories once; existence checks below
+        # are set lookups instead of per-file stat calls
+        notes_names = _list_file_names(notes_dir)
+        if notes_type in ["daily", "weekly", "monthly", "annual"]:
+            analysis_dir = notes_dir / notes_type
+        else:
+            analysis_dir = notes_dir
+        analysis_names = _list_file_names(analysis_dir)
+
         # Find all files matching preference and sort by name (newest first based on timestamp)
-        all_files = []
-        for ext in search_extensions:
-            all_files.extend(notes_dir.glob(f"*{ext}"))
-        all_files = sorted(all_files, reverse=True)
+        # Triaged and raw-notes outputs are dropped by name before any path parsing
+        all_files = sorted(
+            (notes_dir / name for name in notes_names
+             if not name.endswith(_DERIVED_SUFFIXES)
+             and os.path.splitext(name)[1].lower() in search_extensions),
+            reverse=True,
+        )
 
         for notes_path in all_files:
-            # Skip files that are already triaged
-            if ".triaged." in notes_path.name:
-                continue
-
             # Extract timestamp from filename (handles page identifiers)
             timestamp = _extract_timestamp(notes_path.name)
             if not timestamp:
@@ -281,7 +338,7 @@ def _load_all_unanalyzed_task_notes_usb(notes_type: str = "daily", file_preferen
             # Check if this file already has an associated analysis file
             # Use appropriate date format based on analysis type
             try:
-                ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+                ts_date = _timestamp_date(timestamp)
                 if notes_type == "daily":
                     date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
                 elif notes_type == "weekly":
@@ -297,13 +354,10 @@ def _load_all_unanalyzed_task_notes_usb(notes_type: str = "daily", file_preferen
                 continue
             analysis_filename = f"{date_str}.triaged.txt"
             # Analysis files are in subdirectories, not at the same level as raw notes
-            if notes_type in ["daily", "weekly", "monthly", "annual"]:
-                analysis_path = notes_path.parent / notes_type / analysis_filename
-            else:
-                analysis_path = notes_dir / analysis_filename
+            analysis_path = analysis_dir / analysis_filename
 
             # Include file if: no analysis exists OR file was modified after analysis
-            if not analysis_path.exists() or _needs_reanalysis_usb(notes_path, analysis_path):
+            if analysis_filename not in analysis_names or _needs_reanalysis_usb(notes_path, analysis_path):
                 # Parse datetime from the extracted timestamp
                 file_date = parse_filename_datetime(notes_path.name)
                 if not file_date:
@@ -313,9 +367,9 @@ def _load_all_unanalyzed_task_notes_usb(notes_type: str = "daily", file_preferen
                 suffix = notes_path.suffix.lower()
                 if suffix in VISUAL_EXTENSIONS:
                     # Visual files require .raw_notes.txt from Sync - skip if not converted
-                    raw_notes_path = notes_path.parent / f"{timestamp}.raw_notes.txt"
-                    if raw_notes_path.exists():
-                        file_contents = raw_notes_path.read_text()
+                    raw_notes_filename = f"{timestamp}.raw_notes.txt"
+                    if raw_notes_filename in notes_names:
+                        file_contents = (notes_dir / raw_notes_filename).read_text()
                     else:
                         # Skip this file - needs to be synced/converted first
                         continue
@@ -424,7 +478,7 @@ def _save_analysis_usb(analysis: str, input_path: Path, notes_type: str = "daily
     if timestamp:
         # Convert timestamp to appropriate date format based on analysis type
         try:
-            ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+            ts_date = _timestamp_date(timestamp)
             if notes_type == "daily":
                 date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
             elif notes_type == "weekly":
@@ -627,7 +681,7 @@ def _needs_reanalysis_gdrive(notes_type: str, timestamp: str, file_info: dict) -
 
     # Convert timestamp to appropriate date format based on analysis type
     try:
-        ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+        ts_date = _timestamp_date(timestamp)
         if notes_type == "daily":
             date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
         elif notes_type == "weekly":
@@ -666,27 +720,25 @@ def _load_task_notes_gdrive(notes_type: str = "daily", file_preference: str = "p
         Tuple of (file contents, virtual path, parsed datetime from filename)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import (
-        GoogleDriveClient,
-        VISUAL_MIME_TYPES,
-        parse_filename_datetime,
-        extract_timestamp_from_filename,
-    )
 
     client = GoogleDriveClient()
     files = client.list_notes_files(notes_type)
 
+    # Analyses are uploaded to the same subfolder, so one listing answers every
+    # "does an analysis exist?" question without a Drive call per file
+    gdrive_analysis_names = {f["name"] for f in files if f["name"].endswith(".triaged.txt")}
+
     for file_info in files:
         filename = file_info["name"]
         file_id = file_info["id"]
         mime_type = file_info["mimeType"]
 
-        # Skip files that are already triaged
-        if ".triaged." in filename:
+        # Skip triaged and raw-notes outputs before any parsing
+        if filename.endswith(_DERIVED_SUFFIXES):
             continue
 
         # Filter by file type preference
-        file_ext = Path(filename).suffix.lower()
+        file_ext = os.path.splitext(filename)[1].lower()
         if file_preference == "txt":
             if file_ext not in TEXT_EXTENSIONS:
                 continue
@@ -694,18 +746,17 @@ def _load_task_notes_gdrive(notes_type: str = "daily", file_preference: str = "p
             if file_ext not in VISUAL_EXTENSIONS:
                 continue
 
-        # Parse datetime from filename
-        file_date = parse_filename_datetime(filename)
+        # Parse timestamp and datetime from filename
+        timestamp, file_date = parse_filename(filename)
         if not file_date:
             continue
 
         # Check if analysis already exists
         # Use appropriate date format based on analysis type
-        timestamp = extract_timestamp_from_filename(filename)
         if timestamp:
             # Convert timestamp to appropriate date format
             try:
-                ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+                ts_date = _timestamp_date(timestamp)
                 if notes_type == "daily":
                     date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
                 elif notes_type == "weekly":
@@ -735,7 +786,7 @@ def _load_task_notes_gdrive(notes_type: str = "daily", file_preference: str = "p
                 continue
 
         # Fall back to checking Google Drive (for setups without local output)
-        if not LOCAL_OUTPUT_DIR and client.file_exists(notes_type, analysis_filename):
+        if not LOCAL_OUTPUT_DIR and analysis_filename in gdrive_analysis_names:
             continue
 
         # Download and process the file
@@ -777,16 +828,14 @@ def _load_all_unanalyzed_task_notes_gdrive(notes_type: str = "daily", file_prefe
         List of tuples of (file contents, virtual path, parsed datetime from filename)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import (
-        GoogleDriveClient,
-        VISUAL_MIME_TYPES,
-        parse_filename_datetime,
-        extract_timestamp_from_filename,
-    )
 
     client = GoogleDriveClient()
     files = client.list_notes_files(notes_type)
 
+    # Analyses are uploaded to the same subfolder, so one listing answers every
+    # "does an analysis exist?" question without a Drive call per file
+    gdrive_analysis_names = {f["name"] for f in files if f["name"].endswith(".triaged.txt")}
+
     unanalyzed_files = []
 
     for file_info in files:
@@ -794,12 +843,12 @@ def _load_all_unanalyzed_task_notes_gdrive(notes_type: str = "daily", file_prefe
         file_id = file_info["id"]
         mime_type = file_info["mimeType"]
 
-        # Skip files that are already triaged
-        if ".triaged." in filename:
+        # Skip triaged and raw-notes outputs before any parsing
+        if filename.endswith(_DERIVED_SUFFIXES):
             continue
 
         # Filter by file type preference
-        file_ext = Path(filename).suffix.lower()
+        file_ext = os.path.splitext(filename)[1].lower()
         if file_preference == "txt":
             if file_ext not in TEXT_EXTENSIONS:
                 continue
@@ -807,18 +856,17 @@ def _load_all_unanalyzed_task_notes_gdrive(notes_type: str = "daily", file_prefe
             if file_ext not in VISUAL_EXTENSIONS:
                 continue
 
-        # Parse datetime from filename
-        file_date = parse_filename_datetime(filename)
+        # Parse timestamp and datetime from filename
+        timestamp, file_date = parse_filename(filename)
         if not file_date:
             continue
 
         # Check if analysis already exists
         # Use appropriate date format based on analysis type
-        timestamp = extract_timestamp_from_filename(filename)
         if timestamp:
             # Convert timestamp to appropriate date format
             try:
-                ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+                ts_date = _timestamp_date(timestamp)
                 if notes_type == "daily":
                     date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
                 elif notes_type == "weekly":
@@ -848,7 +896,7 @@ def _load_all_unanalyzed_task_notes_gdrive(notes_type: str = "daily", file_prefe
                 continue
 
         # Fall back to checking Google Drive (for setups without local output)
-        if not LOCAL_OUTPUT_DIR and client.file_exists(notes_type, analysis_filename):
+        if not LOCAL_OUTPUT_DIR and analysis_filename in gdrive_analysis_names:
             continue
 
         # Download and process the file
@@ -882,6 +930,40 @@ def _load_all_unanalyzed_task_notes_gdrive(notes_type: str = "daily", file_prefe
     return unanalyzed_files
 
 
+def _read_gdrive_analyses(client: GoogleDriveClient, subfolder: str, files: list[dict]) -> dict[str, str]:
+    """Read analysis files listed in a Google Drive subfolder.
+
+    Files whose copy under LOCAL_OUTPUT_DIR matches the listed md5Checksum
+    are read from disk; the rest are downloaded concurrently.
+
+    Args:
+        client: Google Drive client the files were listed with
+        subfolder: Drive subfolder the files were listed from (e.g., "daily")
+        files: File dicts from list_notes_files
+
+    Returns:
+        Dict mapping each file ID to its text content
+    """
+    from .config import LOCAL_OUTPUT_DIR
+
+    contents = {}
+    to_download = []
+    for file_info in files:
+        if LOCAL_OUTPUT_DIR:
+            local_path = Path(LOCAL_OUTPUT_DIR) / subfolder / file_info["name"]
+            data = client.read_local_copy(local_path, file_info)
+            if data is not None:
+                contents[file_info["id"]] = data.decode("utf-8")
+                continue
+        to_download.append(file_info["id"])
+
+    if to_download:
+        for file_id, data in client.download_many(to_download).items():
+            contents[file_id] = data.decode("utf-8")
+
+    return contents
+
+
 def _collect_weekly_analyses_gdrive_for_week(week_start: datetime, week_end: datetime) -> tuple[str, Path, datetime, datetime]:
     """Collect weekly analyses from Google Drive for a specific work week.
 
@@ -892,8 +974,6 @@ def _collect_weekly_analyses_gdrive_for_week(week_start: datetime, week_end: dat
     Returns:
         Tuple of (combined analysis text, virtual output path, week start, week end)
     """
-    from .gdrive import GoogleDriveClient, parse_filename_datetime
-
     client = GoogleDriveClient()
 
     # List all files in daily folder
@@ -902,7 +982,7 @@ def _collect_weekly_analyses_gdrive_for_week(week_start: datetime, week_end: dat
     except FileNotFoundError:
         raise FileNotFoundError("daily folder not found in Google Drive")
 
-    collected_analyses = []
+    matches = []
     for file_info in sorted(files, key=lambda x: x["name"]):
         filename = file_info["name"]
 
@@ -919,9 +999,16 @@ def _collect_weekly_analyses_gdrive_for_week(week_start: datetime, week_end: dat
             continue
 
         if week_start <= file_date <= week_end:
-            content = client.download_file_text(file_info["id"])
-            date_label = file_date.strftime("%A, %B %d, %Y")
-            collected_analyses.append(f"## {date_label}\n\n{content}")
+            matches.append((file_info, file_date))
+
+    # Read unchanged local copies and download the rest concurrently
+    contents = _read_gdrive_analyses(client, "daily", [file_info for file_info, _ in matches])
+
+    collected_analyses = []
+    for file_info, file_date in matches:
+        content = contents[file_info["id"]]
+        date_label = file_date.strftime("%A, %B %d, %Y")
+        collected_analyses.append(f"## {date_label}\n\n{content}")
 
     if not collected_analyses:
         raise FileNotFoundError(
@@ -951,7 +1038,6 @@ def _save_analysis_gdrive(analysis: str, input_path: Path, notes_type: str = "da
         Path to the saved analysis file (local or virtual gdrive path)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import extract_timestamp_from_filename
 
     # Extract filename from virtual path
     filename = input_path.name
@@ -961,7 +1047,7 @@ def _save_analysis_gdrive(analysis: str, input_path: Path, notes_type: str = "da
     if timestamp:
         # Convert timestamp to appropriate date format based on analysis type
         try:
-            ts_date = datetime.strptime(timestamp[:8], "%Y%m%d")
+            ts_date = _timestamp_date(timestamp)
             if notes_type == "daily":
                 date_str = ts_date.strftime("%d_%m_%Y")  # DD_MM_YYYY
             elif notes_type == "weekly":
@@ -999,7 +1085,6 @@ def _save_analysis_gdrive(analysis: str, input_path: Path, notes_type: str = "da
         return output_path
 
     # Otherwise, attempt to upload to Google Drive
-    from .gdrive import GoogleDriveClient
     client = GoogleDriveClient()
     client.upload_file(subfolder, output_filename, formatted_output)
 
@@ -1016,7 +1101,6 @@ def _raw_text_exists_gdrive(input_path: Path) -> bool:
         True if raw text file exists, False otherwise
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import extract_timestamp_from_filename
 
     filename = input_path.name
     timestamp = extract_timestamp_from_filename(filename)
@@ -1037,7 +1121,6 @@ def _raw_text_exists_gdrive(input_path: Path) -> bool:
 
     # Fall back to checking Google Drive
     if not LOCAL_OUTPUT_DIR:
-        from .gdrive import GoogleDriveClient
         client = GoogleDriveClient()
         return client.file_exists("raw_notes", raw_filename)
 
@@ -1058,7 +1141,6 @@ def _save_raw_text_gdrive(raw_text: str, input_path: Path) -> Path:
         Path to the saved raw text file (local or virtual gdrive path)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import extract_timestamp_from_filename
 
     filename = input_path.name
     timestamp = extract_timestamp_from_filename(filename)
@@ -1080,7 +1162,6 @@ def _save_raw_text_gdrive(raw_text: str, input_path: Path) -> Path:
         return output_path
 
     # Otherwise, attempt to upload to Google Drive
-    from .gdrive import GoogleDriveClient
     client = GoogleDriveClient()
     client.upload_file("raw_notes", output_filename, raw_text)
 
@@ -1164,42 +1245,48 @@ def _get_week_boundaries(date: datetime) -> tuple[datetime, datetime]:
     return monday, friday
 
 
-def _weekly_analysis_exists(week_start: datetime) -> bool:
-    """Check if a weekly analysis already exists for the given week.
+def _existing_analyses(subfolder: str, filenames: list[str]) -> set[str]:
+    """Find which of the given analysis files already exist.
+
+    For Google Drive sources, LOCAL_OUTPUT_DIR is checked first and the
+    remaining names are checked in Drive together rather than one request
+    per file.
 
     Args:
-        week_start: Monday date of the week to check
+        subfolder: Analysis subfolder (e.g., "weekly", "monthly", "annual")
+        filenames: Analysis filenames to check (e.g., "29_12_2025.triaged.txt")
 
     Returns:
-        True if weekly analysis exists, False otherwise
+        Set of the filenames that exist
     """
     source = get_active_source()
-    week_label = week_start.strftime("%d_%m_%Y")  # DD_MM_YYYY format matches save function
 
     if source == "gdrive":
-        from .gdrive import GoogleDriveClient
         from .config import LOCAL_OUTPUT_DIR
 
         # Check local output directory first
-        if LOCAL_OUTPUT_DIR:
-            analysis_path = Path(LOCAL_OUTPUT_DIR) / "weekly" / f"{week_label}.triaged.txt"
-            if analysis_path.exists():
-                return True
+        existing = set()
+        remaining = []
+        for filename in filenames:
+            if LOCAL_OUTPUT_DIR and (Path(LOCAL_OUTPUT_DIR) / subfolder / filename).exists():
+                existing.add(filename)
+            else:
+                remaining.append(filename)
 
         # Check Google Drive
-        client = GoogleDriveClient()
-        return client.file_exists("weekly", f"{week_label}.triaged.txt")
+        if remaining:
+            client = GoogleDriveClient()
+            found = client.file_exists_many(subfolder, remaining)
+            existing.update(filename for filename, exists in found.items() if exists)
+        return existing
     else:
         # Check USB/local directory
         try:
             base_dir = get_primary_input_directory()
         except ValueError:
-            return False
-        weekly_dir = base_dir / "weekly"
-        if not weekly_dir.exists():
-            return False
-        analysis_path = weekly_dir / f"{week_label}.triaged.txt"
-        return analysis_path.exists()
+            return set()
+        analysis_dir = base_dir / subfolder
+        return {filename for filename in filenames if (analysis_dir / filename).exists()}
 
 
 def _find_weeks_needing_analysis() -> list[tuple[datetime, datetime]]:
@@ -1218,9 +1305,8 @@ def _find_weeks_needing_analysis() -> list[tuple[datetime, datetime]]:
     analysis_dates = []
 
     if source == "gdrive":
-        from .gdrive import GoogleDriveClient, parse_filename_datetime
         client = GoogleDriveClient()
-        files = client.list_notes_files("daily")
+        files = client.iter_notes_files("daily")
 
         for file_info in files:
             filename = file_info["name"]
@@ -1267,6 +1353,12 @@ def _find_weeks_needing_analysis() -> list[tuple[datetime, datetime]]:
             }
         weeks_map[week_key]["dates"].append(file_date)
 
+    # Weekly analyses are named by their Monday (DD_MM_YYYY, matching the save function)
+    existing = _existing_analyses(
+        "weekly",
+        [f"{week_data['start'].strftime('%d_%m_%Y')}.triaged.txt" for week_data in weeks_map.values()],
+    )
+
     # Determine which weeks need analysis
     weeks_needing_analysis = []
     today = datetime.now()
@@ -1277,7 +1369,7 @@ def _find_weeks_needing_analysis() -> list[tuple[datetime, datetime]]:
         dates = week_data["dates"]
 
         # Skip if weekly analysis already exists
-        if _weekly_analysis_exists(week_start):
+        if f"{week_start.strftime('%d_%m_%Y')}.triaged.txt" in existing:
             continue
 
         # Count weekday analyses (Monday=0 through Friday=4)
@@ -1415,15 +1507,13 @@ def _collect_monthly_analyses_gdrive_for_month(month_start: datetime, month_end:
         Tuple of (combined analysis text, virtual path, month start, month end)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import GoogleDriveClient, parse_filename_datetime
 
     client = GoogleDriveClient()
     files = client.list_notes_files("weekly")
 
-    collected_analyses = []
+    matches = []
     for file_info in files:
         filename = file_info["name"]
-        file_id = file_info["id"]
 
         if ".triaged.txt" not in filename:
             continue
@@ -1433,11 +1523,17 @@ def _collect_monthly_analyses_gdrive_for_month(month_start: datetime, month_end:
             continue
 
         if month_start <= file_date <= month_end:
-            content = client.download_file_text(file_id)
-            # Calculate week boundaries for better labeling
-            week_start, week_end = _get_week_boundaries(file_date)
-            week_label = f"{week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}"
-            collected_analyses.append(f"## Week of {week_label}\n\n{content}")
+            matches.append((file_info, file_date))
+
+    contents = _read_gdrive_analyses(client, "weekly", [file_info for file_info, _ in matches])
+
+    collected_analyses = []
+    for file_info, file_date in matches:
+        content = contents[file_info["id"]]
+        # Calculate week boundaries for better labeling
+        week_start, week_end = _get_week_boundaries(file_date)
+        week_label = f"{week_start.strftime('%B %d')} - {week_end.strftime('%B %d, %Y')}"
+        collected_analyses.append(f"## Week of {week_label}\n\n{content}")
 
     if not collected_analyses:
         raise FileNotFoundError(
@@ -1460,44 +1556,6 @@ def _collect_monthly_analyses_gdrive_for_month(month_start: datetime, month_end:
     return combined_text, output_path, month_start, month_end
 
 
-def _monthly_analysis_exists(month_start: datetime) -> bool:
-    """Check if a monthly analysis already exists for the given month.
-
-    Args:
-        month_start: First day of the month to check
-
-    Returns:
-        True if monthly analysis exists, False otherwise
-    """
-    source = get_active_source()
-    month_label = month_start.strftime("%m_%Y")  # MM_YYYY format matches save function
-
-    if source == "gdrive":
-        from .gdrive import GoogleDriveClient
-        from .config import LOCAL_OUTPUT_DIR
-
-        # Check local output directory first
-        if LOCAL_OUTPUT_DIR:
-            analysis_path = Path(LOCAL_OUTPUT_DIR) / "monthly" / f"{month_label}.triaged.txt"
-            if analysis_path.exists():
-                return True
-
-        # Check Google Drive
-        client = GoogleDriveClient()
-        return client.file_exists("monthly", f"{month_label}.triaged.txt")
-    else:
-        # Check USB/local directory
-        try:
-            base_dir = get_primary_input_directory()
-        except ValueError:
-            return False
-        monthly_dir = base_dir / "monthly"
-        if not monthly_dir.exists():
-            return False
-        analysis_path = monthly_dir / f"{month_label}.triaged.txt"
-        return analysis_path.exists()
-
-
 def _find_months_needing_analysis() -> list[tuple[datetime, datetime]]:
     """Find all months that should have monthly analyses but don't.
 
@@ -1514,9 +1572,8 @@ def _find_months_needing_analysis() -> list[tuple[datetime, datetime]]:
     analysis_dates = []
 
     if source == "gdrive":
-        from .gdrive import GoogleDriveClient, parse_filename_datetime
         client = GoogleDriveClient()
-        files = client.list_notes_files("weekly")
+        files = client.iter_notes_files("weekly")
 
         for file_info in files:
             filename = file_info["name"]
@@ -1557,6 +1614,12 @@ def _find_months_needing_analysis() -> list[tuple[datetime, datetime]]:
             }
         months_map[month_key]["dates"].append(file_date)
 
+    # Monthly analyses are named MM_YYYY, matching the save function
+    existing = _existing_analyses(
+        "monthly",
+        [f"{month_data['start'].strftime('%m_%Y')}.triaged.txt" for month_data in months_map.values()],
+    )
+
     # Determine which months need analysis
     months_needing_analysis = []
     today = datetime.now()
@@ -1567,7 +1630,7 @@ def _find_months_needing_analysis() -> list[tuple[datetime, datetime]]:
         dates = month_data["dates"]
 
         # Skip if monthly analysis already exists
-        if _monthly_analysis_exists(month_start):
+        if f"{month_start.strftime('%m_%Y')}.triaged.txt" in existing:
             continue
 
         # Condition 1: Has 4+ weekly analyses
@@ -1674,15 +1737,13 @@ def _collect_annual_analyses_gdrive_for_year(year: int) -> tuple[str, Path, int]
         Tuple of (combined analysis text, virtual path, year)
     """
     from .config import LOCAL_OUTPUT_DIR
-    from .gdrive import GoogleDriveClient, parse_filename_datetime
 
     client = GoogleDriveClient()
     files = client.list_notes_files("monthly")
 
-    collected_analyses = []
+    matches = []
     for file_info in files:
         filename = file_info["name"]
-        file_id = file_info["id"]
 
         if ".triaged.txt" not in filename:
             continue
@@ -1691,7 +1752,13 @@ def _collect_annual_analyses_gdrive_for_year(year: int) -> tuple[str, Path, int]
         if not file_date or file_date.year != year:
             continue
 
-        content = client.download_file_text(file_id)
+        matches.append((file_info, file_date))
+
+    contents = _read_gdrive_analyses(client, "monthly", [file_info for file_info, _ in matches])
+
+    collected_analyses = []
+    for file_info, file_date in matches:
+        content = contents[file_info["id"]]
         month_label = file_date.strftime("%B")
         collected_analyses.append(f"## {month_label} {year}\n\n{content}")
 
@@ -1712,43 +1779,6 @@ def _collect_annual_analyses_gdrive_for_year(year: int) -> tuple[str, Path, int]
     return combined_text, output_path, year
 
 
-def _annual_analysis_exists(year: int) -> bool:
-    """Check if an annual analysis already exists for the given year.
-
-    Args:
-        year: The calendar year to check
-
-    Returns:
-        True if annual analysis exists, False otherwise
-    """
-    source = get_active_source()
-
-    if source == "gdrive":
-        from .gdrive import GoogleDriveClient
-        from .config import LOCAL_OUTPUT_DIR
-
-        # Check local output directory first
-        if LOCAL_OUTPUT_DIR:
-            analysis_path = Path(LOCAL_OUTPUT_DIR) / "annual" / f"{year}.triaged.txt"
-            if analysis_path.exists():
-                return True
-
-        # Check Google Drive
-        client = GoogleDriveClient()
-        return client.file_exists("annual", f"{year}.triaged.txt")
-    else:
-        # Check USB/local directory
-        try:
-            base_dir = get_primary_input_directory()
-        except ValueError:
-            return False
-        annual_dir = base_dir / "annual"
-        if not annual_dir.exists():
-            return False
-        analysis_path = annual_dir / f"{year}.triaged.txt"
-        return analysis_path.exists()
-
-
 def _find_years_needing_analysis() -> list[int]:
     """Find all years that should have annual analyses but don't.
 
@@ -1766,9 +1796,8 @@ def _find_years_needing_analysis() -> list[int]:
 
     try:
         if source == "gdrive":
-            from .gdrive import GoogleDriveClient, parse_filename_datetime
             client = GoogleDriveClient()
-            files = client.list_notes_files("monthly")
+            files = client.iter_notes_files("monthly")
 
             for file_info in files:
                 filename = file_info["name"]
@@ -1800,13 +1829,15 @@ def _find_years_needing_analysis() -> list[int]:
     if not analysis_years:
         return []
 
+    existing = _existing_analyses("annual", [f"{year}.triaged.txt" for year in analysis_years])
+
     # Determine which years need analysis
     years_needing_analysis = []
     today = datetime.now()
 
     for year, count in analysis_years.items():
         # Skip if annual analysis already exists
-        if _annual_analysis_exists(year):
+        if f"{year}.triaged.txt" in existing:
             continue
 
         # Condition 1: Has 12 monthly analyses
@@ -5,27 +5,56 @@ Provides functionality to read task notes from a Google Drive folder
 as an alternative to the local USB directory.
 """
 
-import io
+import hashlib
 import os
 import re
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # installed alongside langsmith on CPython only
+    orjson = None
 
 # Google Drive API scopes (read and write access for uploading analysis files)
 SCOPES = ["https://www.googleapis.com/auth/drive"]
 
 # Supported MIME types for notes files
-TEXT_MIME_TYPES = {"text/plain"}
-IMAGE_MIME_TYPES = {"image/png"}
-PDF_MIME_TYPES = {"application/pdf"}
+TEXT_MIME_TYPES = frozenset({"text/plain"})
+IMAGE_MIME_TYPES = frozenset({"image/png"})
+PDF_MIME_TYPES = frozenset({"application/pdf"})
 VISUAL_MIME_TYPES = IMAGE_MIME_TYPES | PDF_MIME_TYPES
 ALL_MIME_TYPES = TEXT_MIME_TYPES | VISUAL_MIME_TYPES
 
+# files.list query clause matching any supported MIME type, built once
+_MIME_QUERY = " or ".join(f"mimeType = '{mime}'" for mime in sorted(ALL_MIME_TYPES))
+
+# Partial-response field masks, so Drive returns only the metadata each call
+# reads instead of the full file resource
+_LIST_FIELDS = "nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum)"
+_FOLDER_FIELDS = "files(id, name)"
+_EXISTS_FIELDS = "files(name, parents)"
+_LOOKUP_FIELDS = "files(id)"
+
+# Retries for read requests on rate-limit (429) and 5xx responses; the client
+# library backs off exponentially between attempts
+_NUM_RETRIES = 5
+
+# Names matched per files.list query, keeping the query string well inside
+# Drive's URL length limit
+_NAMES_PER_QUERY = 100
+
 # Map MIME types to file extensions
 MIME_TO_EXT = {
     "text/plain": ".txt",
@@ -34,6 +63,57 @@ MIME_TO_EXT = {
 }
 
 
+class _DriveJsonModel(JsonModel):
+    """JsonModel that parses response bytes with orjson when it is installed.
+
+    Large files.list pages spend most of their client-side time in JSON
+    decoding; orjson parses the raw bytes without a str intermediate.
+    """
+
+    def deserialize(self, content):
+        if orjson is not None:
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                    body = body["data"]
+                return body
+        return super().deserialize(content)
+
+
+_JSON_MODEL = _DriveJsonModel()
+
+# Timestamp patterns tried in order by parse_filename_datetime, most specific
+# first, with one capture group per datetime field
+_DATETIME_PATTERNS = (
+    re.compile(r"(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})"),  # YYYYMMDD_HHMMSS
+    re.compile(r"(\d{4})(\d{2})(\d{2})"),  # YYYYMMDD for weekly
+    re.compile(r"(\d{4})(\d{2})"),  # YYYYMM for monthly
+    re.compile(r"(\d{4})"),  # YYYY for annual
+)
+
+# Notes filename: YYYYMMDD_HHMMSS, optional _Page_N, then an extension or the end
+_NOTES_TIMESTAMP_RE = re.compile(r"^(\d{8}_\d{6})(?:_Page_\d+)?(?:\.|$)")
+
+# Subfolder name -> ID, per root folder, shared by every client in the process
+# with the time the root's map was started. A map older than _FOLDER_ID_TTL
+# seconds is discarded, so a deleted or recreated folder is looked up again.
+_FOLDER_ID_TTL = 5 * 60
+_subfolder_ids: dict[str, tuple[float, dict[str, str]]] = {}
+
+# Notes file names from the latest full listing of each (root folder,
+# subfolder), with the time it was fetched. A name in a listing younger than
+# _LISTING_TTL seconds is known to exist without another query; a name missing
+# from it is still queried, since another process may have uploaded it since.
+_LISTING_TTL = 60.0
+_listings: dict[tuple[str, str], tuple[float, frozenset[str]]] = {}
+
+# Extensions of the files a notes listing can contain (see ALL_MIME_TYPES)
+_LISTED_EXTENSIONS = tuple(MIME_TO_EXT.values())
+
+
 class GoogleDriveClient:
     """Client for interacting with Google Drive API using OAuth 2.0."""
 
@@ -62,19 +142,27 @@ class GoogleDriveClient:
                 "Set GOOGLE_DRIVE_FOLDER_ID in .env or pass folder_id."
             )
 
-        self._service = None
-        self._folder_cache = {}
-
     @property
+    def _folder_cache(self) -> dict[str, str]:
+        """Cached subfolder IDs for this root folder, restarted once expired."""
+        cached = _subfolder_ids.get(self.folder_id)
+        now = time.monotonic()
+        if cached is None or now - cached[0] > _FOLDER_ID_TTL:
+            cached = _subfolder_ids[self.folder_id] = (now, {})
+        return cached[1]
+
+    @cached_property
     def service(self):
-        """Lazily initialize and return the Google Drive service."""
-        if self._service is None:
-            # Refresh if expired
-            if self.credentials.expired and self.credentials.refresh_token:
-                self.credentials.refresh(Request())
+        """Lazily initialize and return the Google Drive service.
+
+        Built on first access and stored in the instance __dict__, so later
+        accesses are plain attribute lookups.
+        """
+        # Refresh if expired
+        if self.credentials.expired and self.credentials.refresh_token:
+            self.credentials.refresh(Request())
 
-            self._service = build("drive", "v3", credentials=self.credentials)
-        return self._service
+        return build("drive", "v3", credentials=self.credentials, model=_JSON_MODEL)
 
     def get_subfolder_id(self, subfolder_name: str) -> str | None:
         """Get the ID of a subfolder within the root folder.
@@ -85,29 +173,45 @@ class GoogleDriveClient:
         Returns:
             The folder ID, or None if not found.
         """
-        if subfolder_name in self._folder_cache:
-            return self._folder_cache[subfolder_name]
+        folder_id = self._folder_cache.get(subfolder_name)
+        if folder_id:
+            return folder_id
 
-        query = (
-            f"'{self.folder_id}' in parents and "
-            f"name = '{subfolder_name}' and "
-            f"mimeType = 'application/vnd.google-apps.folder' and "
-            f"trashed = false"
-        )
+        return self.get_subfolder_ids([subfolder_name]).get(subfolder_name)
 
-        results = self.service.files().list(
-            q=query,
-            fields="files(id, name)",
-            pageSize=1
-        ).execute()
+    def get_subfolder_ids(self, subfolder_names: Iterable[str]) -> dict[str, str]:
+        """Get the IDs of several subfolders with a single files.list request.
 
-        files = results.get("files", [])
-        if files:
-            folder_id = files[0]["id"]
-            self._folder_cache[subfolder_name] = folder_id
-            return folder_id
+        Names already cached are not looked up again.
 
-        return None
+        Args:
+            subfolder_names: Names of the subfolders (e.g., ["daily", "weekly"])
+
+        Returns:
+            Dict mapping each subfolder name that exists to its folder ID
+        """
+        names = list(dict.fromkeys(subfolder_names))
+        folder_cache = self._folder_cache
+        missing = [name for name in names if name not in folder_cache]
+
+        if missing:
+            query = (
+                f"'{self.folder_id}' in parents and "
+                f"({_name_clause(missing)}) and "
+                f"mimeType = 'application/vnd.google-apps.folder' and "
+                f"trashed = false"
+            )
+
+            results = self.service.files().list(
+                q=query,
+                fields=_FOLDER_FIELDS,
+                pageSize=1000
+            ).execute(num_retries=_NUM_RETRIES)
+
+            for folder in results.get("files", []):
+                folder_cache.setdefault(folder["name"], folder["id"])
+
+        return {name: folder_cache[name] for name in names if name in folder_cache}
 
     def list_notes_files(self, subfolder_name: str) -> list[dict]:
         """List all notes files in a subfolder.
@@ -118,6 +222,28 @@ class GoogleDriveClient:
         Returns:
             List of file metadata dicts with keys: id, name, mimeType, modifiedTime
 
+        Raises:
+            FileNotFoundError: If the subfolder doesn't exist.
+        """
+        files = list(self.iter_notes_files(subfolder_name))
+        _listings[(self.folder_id, subfolder_name)] = (
+            time.monotonic(),
+            frozenset(f["name"] for f in files),
+        )
+        return files
+
+    def iter_notes_files(self, subfolder_name: str, page_size: int = 1000) -> Iterator[dict]:
+        """Yield notes files in a subfolder one page at a time.
+
+        Files from the first page are available before later pages are fetched.
+
+        Args:
+            subfolder_name: Name of the subfolder (e.g., "daily", "weekly")
+            page_size: Files per list request (Drive allows up to 1000)
+
+        Yields:
+            File metadata dicts with keys: id, name, mimeType, modifiedTime
+
         Raises:
             FileNotFoundError: If the subfolder doesn't exist.
         """
@@ -127,35 +253,44 @@ class GoogleDriveClient:
                 f"Subfolder '{subfolder_name}' not found in Google Drive folder"
             )
 
-        # Build query for supported file types
-        mime_conditions = " or ".join(
-            f"mimeType = '{mime}'" for mime in ALL_MIME_TYPES
-        )
-        query = (
-            f"'{folder_id}' in parents and "
-            f"({mime_conditions}) and "
-            f"trashed = false"
-        )
-
-        all_files = []
         page_token = None
 
         while True:
-            results = self.service.files().list(
-                q=query,
-                fields="nextPageToken, files(id, name, mimeType, modifiedTime)",
-                pageSize=100,
-                pageToken=page_token,
-                orderBy="name desc"
-            ).execute()
-
-            all_files.extend(results.get("files", []))
+            try:
+                results = self._list_page(folder_id, page_size, page_token)
+            except HttpError as e:
+                if e.resp.status != 404 or page_token is not None:
+                    raise
+                # The cached subfolder ID is stale; resolve it afresh and retry once
+                self._folder_cache.pop(subfolder_name, None)
+                folder_id = self.get_subfolder_id(subfolder_name)
+                if not folder_id:
+                    raise FileNotFoundError(
+                        f"Subfolder '{subfolder_name}' not found in Google Drive folder"
+                    ) from e
+                results = self._list_page(folder_id, page_size, page_token)
+
+            yield from results.get("files", [])
             page_token = results.get("nextPageToken")
 
             if not page_token:
                 break
 
-        return all_files
+    def _list_page(self, folder_id: str, page_size: int, page_token: str | None) -> dict:
+        """Fetch one page of notes files in a folder."""
+        query = (
+            f"'{folder_id}' in parents and "
+            f"({_MIME_QUERY}) and "
+            f"trashed = false"
+        )
+
+        return self.service.files().list(
+            q=query,
+            fields=_LIST_FIELDS,
+            pageSize=page_size,
+            pageToken=page_token,
+            orderBy="name desc"
+        ).execute(num_retries=_NUM_RETRIES)
 
     def download_file(self, file_id: str) -> bytes:
         """Download a file's content.
@@ -166,16 +301,36 @@ class GoogleDriveClient:
         Returns:
             The file content as bytes
         """
-        request = self.service.files().get_media(fileId=file_id)
-        buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
+        return self._fetch_media(file_id)
 
-        done = False
-        while not done:
-            _, done = downloader.next_chunk()
+    def download_many(self, file_ids: Iterable[str], max_workers: int = 8) -> dict[str, bytes]:
+        """Download several files concurrently.
 
-        buffer.seek(0)
-        return buffer.read()
+        Each worker thread builds its own Drive service, since the HTTP
+        transport underneath a service is not thread-safe.
+
+        Args:
+            file_ids: Google Drive file IDs to download
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dict mapping each file ID to its content as bytes
+        """
+        ids = list(dict.fromkeys(file_ids))
+        if not ids:
+            return {}
+
+        # Build the shared service first so expired credentials are refreshed once
+        _ = self.service
+        local = threading.local()
+
+        def download(file_id: str) -> bytes:
+            if not hasattr(local, "service"):
+                local.service = build("drive", "v3", credentials=self.credentials, model=_JSON_MODEL)
+            return self._fetch_media(file_id, service=local.service)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(ids, executor.map(download, ids)))
 
     def download_file_text(self, file_id: str) -> str:
         """Download a text file's content as a string.
@@ -186,12 +341,53 @@ class GoogleDriveClient:
         Returns:
             The file content as a string
         """
-        content = self.download_file(file_id)
-        return content.decode("utf-8")
+        return self._fetch_media(file_id).decode("utf-8")
+
+    @staticmethod
+    def read_local_copy(local_path: Path, file_info: dict) -> bytes | None:
+        """Read a local copy of a listed Drive file if it is unchanged.
+
+        Compares the md5Checksum returned by list_notes_files against the
+        local file, so an unchanged file is read from disk instead of being
+        downloaded again.
+
+        Args:
+            local_path: Path to the local copy of the file
+            file_info: File dict from list_notes_files
+
+        Returns:
+            The local file's bytes if they match the listed checksum, else None
+        """
+        checksum = file_info.get("md5Checksum")
+        if not checksum or not local_path.is_file():
+            return None
+        data = local_path.read_bytes()
+        if hashlib.md5(data, usedforsecurity=False).hexdigest() != checksum:
+            return None
+        return data
+
+    def _fetch_media(self, file_id: str, service=None) -> bytes:
+        """Fetch a file's content with a single alt=media GET.
+
+        Notes files are small, so the whole body is read in one response
+        rather than through MediaIoBaseDownload's chunk loop and buffer.
+
+        Args:
+            file_id: The Google Drive file ID
+            service: Drive service to use instead of self.service
+
+        Returns:
+            The file content as bytes
+        """
+        service = service or self.service
+        return service.files().get_media(fileId=file_id).execute(num_retries=_NUM_RETRIES)
 
     def file_exists(self, subfolder_name: str, filename: str) -> bool:
         """Check if a specific file exists in a subfolder.
 
+        A file named in a recent list_notes_files result for the subfolder is
+        reported without a request; any other name is looked up in Drive.
+
         Args:
             subfolder_name: Name of the subfolder (e.g., "daily")
             filename: Name of the file to check
@@ -199,23 +395,119 @@ class GoogleDriveClient:
         Returns:
             True if the file exists, False otherwise
         """
+        listed = self._listed_names(subfolder_name, filename)
+        if listed is not None and filename in listed:
+            return True
+
         folder_id = self.get_subfolder_id(subfolder_name)
         if not folder_id:
             return False
 
+        results = self._file_lookup_request(folder_id, filename).execute(num_retries=_NUM_RETRIES)
+
+        return len(results.get("files", [])) > 0
+
+    def _listed_names(self, subfolder_name: str, filename: str) -> frozenset[str] | None:
+        """Return a fresh cached listing that can answer whether filename exists.
+
+        Args:
+            subfolder_name: Name of the subfolder (e.g., "daily")
+            filename: Name of the file being checked
+
+        Returns:
+            Names from a listing younger than _LISTING_TTL, or None if there is none
+        """
+        # Listings only hold supported notes types, so other names always query
+        if not filename.endswith(_LISTED_EXTENSIONS):
+            return None
+        listed = _listings.get((self.folder_id, subfolder_name))
+        if listed and time.monotonic() - listed[0] < _LISTING_TTL:
+            return listed[1]
+        return None
+
+    def file_exists_many(self, subfolder_name: str, filenames: Iterable[str]) -> dict[str, bool]:
+        """Check whether several files exist in a subfolder.
+
+        Args:
+            subfolder_name: Name of the subfolder (e.g., "daily")
+            filenames: Names of the files to check
+
+        Returns:
+            Dict mapping each filename to True if it exists, False otherwise
+        """
+        exists = self.batch_file_exists((subfolder_name, name) for name in filenames)
+        return {name: found for (_, name), found in exists.items()}
+
+    def batch_file_exists(self, pairs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], bool]:
+        """Check whether files exist, across any number of subfolders.
+
+        Files named in a recent list_notes_files result are answered locally.
+        The remaining subfolders are resolved together, and each files.list
+        request then matches up to _NAMES_PER_QUERY (subfolder, filename)
+        pairs, instead of one HTTP round-trip per file.
+
+        Args:
+            pairs: (subfolder name, filename) pairs to check
+
+        Returns:
+            Dict mapping each pair to True if the file exists, False otherwise
+        """
+        exists = {}
+        unlisted = []
+        for subfolder, name in dict.fromkeys(pairs):
+            listed = self._listed_names(subfolder, name)
+            if listed is not None and name in listed:
+                exists[(subfolder, name)] = True
+            else:
+                exists[(subfolder, name)] = False
+                unlisted.append((subfolder, name))
+        if not unlisted:
+            return exists
+
+        folder_ids = self.get_subfolder_ids(subfolder for subfolder, _ in unlisted)
+        subfolder_by_id = {folder_id: subfolder for subfolder, folder_id in folder_ids.items()}
+        pending = [(subfolder, name) for subfolder, name in unlisted if subfolder in folder_ids]
+
+        for start in range(0, len(pending), _NAMES_PER_QUERY):
+            names_by_subfolder: dict[str, list[str]] = {}
+            for subfolder, name in pending[start:start + _NAMES_PER_QUERY]:
+                names_by_subfolder.setdefault(subfolder, []).append(name)
+
+            folder_clause = " or ".join(
+                f"('{folder_ids[subfolder]}' in parents and ({_name_clause(names)}))"
+                for subfolder, names in names_by_subfolder.items()
+            )
+            query = f"({folder_clause}) and trashed = false"
+
+            # At most _NAMES_PER_QUERY names, so one page holds every match
+            # unless a name is duplicated many times over
+            results = self.service.files().list(
+                q=query,
+                fields=_EXISTS_FIELDS,
+                pageSize=1000
+            ).execute(num_retries=_NUM_RETRIES)
+
+            for file in results.get("files", []):
+                for parent in file.get("parents", []):
+                    key = (subfolder_by_id.get(parent), file["name"])
+                    if key in exists:
+                        exists[key] = True
+
+        return exists
+
+    def _file_lookup_request(self, folder_id: str, filename: str):
+        """Build a files.list request matching one filename in a folder."""
         query = (
             f"'{folder_id}' in parents and "
             f"name = '{filename}' and "
             f"trashed = false"
         )
 
-        results = self.service.files().list(
+        return self.service.files().list(
             q=query,
-            fields="files(id)",
+            fields=_LOOKUP_FIELDS,
             pageSize=1
-        ).execute()
-
-        return len(results.get("files", [])) > 0
+        )
 
     def upload_file(self, subfolder_name: str, filename: str, content: str) -> str:
         """Upload a text file to a subfolder.
@@ -251,15 +543,32 @@ class GoogleDriveClient:
             resumable=True
         )
 
-        file = self.service.files().create(
-            body=file_metadata,
-            media_body=media,
-            fields="id"
-        ).execute()
+        try:
+            file = self.service.files().create(
+                body=file_metadata,
+                media_body=media,
+                fields="id"
+            ).execute()
+        except HttpError as e:
+            if e.resp.status == 404:
+                # The cached subfolder ID is stale; resolve it afresh next time
+                self._folder_cache.pop(subfolder_name, None)
+            raise
+
+        # Keep a cached listing in step with the upload
+        key = (self.folder_id, subfolder_name)
+        if key in _listings:
+            fetched_at, names = _listings[key]
+            _listings[key] = (fetched_at, names | {filename})
 
         return file.get("id")
 
 
+def _name_clause(names: Iterable[str]) -> str:
+    """Build a files.list clause matching any of the given names."""
+    return " or ".join(f"name = '{name}'" for name in names)
+
+
 def is_gdrive_configured() -> bool:
     """Check if Google Drive is configured with OAuth.
 
@@ -273,9 +582,13 @@ def is_gdrive_configured() -> bool:
     return bool(client_id and client_secret and folder_id)
 
 
+@lru_cache(maxsize=2048)
 def parse_filename_datetime(filename: str) -> datetime | None:
     """Parse datetime from filename in various formats.
 
+    Results are memoized per filename, since directory scans and sorts parse
+    the same names repeatedly.
+
     Supports:
         - YYYYMMDD_HHMMSS (daily notes with timestamps)
         - YYYYMMDD (weekly/analysis files)
@@ -293,57 +606,62 @@ def parse_filename_datetime(filename: str) -> datetime | None:
     Returns:
         Parsed datetime, or None if parsing fails
     """
-    patterns = [
-        r"(\d{8}_\d{6})",  # YYYYMMDD_HHMMSS
-        r"(\d{8})",  # YYYYMMDD for weekly
-        r"(\d{6})",  # YYYYMM for monthly
-        r"(\d{4})",  # YYYY for annual
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _DATETIME_PATTERNS:
+        match = pattern.search(filename)
         if match:
-            ts = match.group(1)
+            fields = [int(group) for group in match.groups()]
+            # Month and day default to 1 for YYYYMM and YYYY
+            fields.extend([1] * (3 - len(fields)))
             try:
-                if len(ts) == 15:  # YYYYMMDD_HHMMSS
-                    return datetime.strptime(ts, "%Y%m%d_%H%M%S")
-                elif len(ts) == 8:  # YYYYMMDD
-                    return datetime.strptime(ts, "%Y%m%d")
-                elif len(ts) == 6:  # YYYYMM
-                    return datetime.strptime(ts, "%Y%m")
-                elif len(ts) == 4:  # YYYY
-                    return datetime.strptime(ts, "%Y")
+                return datetime(*fields)
             except ValueError:
                 continue
     return None
 
 
-def extract_timestamp_from_filename(filename: str) -> str | None:
-    """Extract the timestamp portion from a notes filename.
+@lru_cache(maxsize=2048)
+def parse_filename(filename: str) -> tuple[str | None, datetime | None]:
+    """Extract a notes filename's timestamp and its datetime in one pass.
 
-    Handles filenames with optional page identifiers.
+    For YYYYMMDD_HHMMSS notes names the datetime is built from the matched
+    timestamp directly; anything else falls back to parse_filename_datetime.
 
     Args:
         filename: Filename with timestamp prefix
 
     Returns:
-        Timestamp string (YYYYMMDD_HHMMSS) or None if not found
+        Tuple of (extract_timestamp_from_filename result,
+        parse_filename_datetime result)
     """
-    stem = Path(filename).stem
+    match = _NOTES_TIMESTAMP_RE.match(filename)
+    if not match:
+        return None, parse_filename_datetime(filename)
+
+    ts = match.group(1)
+    try:
+        return ts, datetime(
+            int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+            int(ts[9:11]), int(ts[11:13]), int(ts[13:15]),
+        )
+    except ValueError:
+        return ts, parse_filename_datetime(filename)
 
-    # Handle analysis files
-    if "." in stem:
-        stem = stem.split(".")[0]
 
-    # Handle page identifiers
-    if "_Page_" in stem:
-        stem = stem.split("_Page_")[0]
+@lru_cache(maxsize=2048)
+def extract_timestamp_from_filename(filename: str) -> str | None:
+    """Extract the timestamp portion from a notes filename.
 
-    # Validate it looks like a timestamp
-    if len(stem) == 15 and stem[8] == "_":
-        return stem
+    Handles filenames with optional page identifiers. Results are memoized
+    per filename, like parse_filename_datetime.
 
-    return None
+    Args:
+        filename: Filename with timestamp prefix
+
+    Returns:
+        Timestamp string (YYYYMMDD_HHMMSS) or None if not found
+    """
+    match = _NOTES_TIMESTAMP_RE.match(filename)
+    return match.group(1) if match else None
 
 
 def get_file_extension(mime_type: str) -> str:
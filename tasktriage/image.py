@@ -6,20 +6,23 @@ Uses Claude's vision API to extract text from handwritten note images.
 
 import base64
 import io
+import mmap
+import os
 from pathlib import Path
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
 from pdf2image import convert_from_path
+from PIL import Image, ImageOps
 
-from .config import fetch_api_key, load_model_config, DEFAULT_MODEL
+from .config import fetch_api_key, load_model_config, DEFAULT_MODEL, IMAGE_MAX_DIMENSION
 from .prompts import IMAGE_EXTRACTION_PROMPT
 
 # Supported image file extensions
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
 
 # Supported PDF file extensions
-PDF_EXTENSIONS = {".pdf"}
+PDF_EXTENSIONS = frozenset({".pdf"})
 
 # All visual document extensions (images and PDFs)
 VISUAL_EXTENSIONS = IMAGE_EXTENSIONS | PDF_EXTENSIONS
@@ -35,6 +38,69 @@ MEDIA_TYPE_MAP = {
 }
 
 
+# EXIF tag holding how the camera was rotated when the photo was taken
+_EXIF_ORIENTATION = 0x0112
+
+# Pillow formats that are re-encoded after downscaling, with their save options
+_RESIZABLE_FORMATS = {
+    "PNG": {"optimize": True},
+    "JPEG": {"quality": 90},
+    "WEBP": {"quality": 90},
+}
+
+
+def _encode_image_base64(path: Path) -> str:
+    """Base64-encode an image, downscaling it first if it is oversized.
+
+    Images whose longest edge exceeds IMAGE_MAX_DIMENSION, or that carry an
+    EXIF rotation, are turned upright, resized to fit and re-encoded in their
+    original format; anything else is sent as-is.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        The (possibly downscaled) image as a base64 string
+    """
+    try:
+        with Image.open(path) as image:
+            image_format = image.format
+            rotated = image.getexif().get(_EXIF_ORIENTATION, 1) != 1
+            oversized = max(image.size) > IMAGE_MAX_DIMENSION
+            if (rotated or oversized) and image_format in _RESIZABLE_FORMATS:
+                # Re-encoding drops EXIF, so bake its orientation into the pixels first
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                image.save(buffer, format=image_format, **_RESIZABLE_FORMATS[image_format])
+                return base64.standard_b64encode(buffer.getbuffer()).decode("ascii")
+    except (OSError, Image.DecompressionBombError):
+        # Unreadable, truncated or partly synced images are sent as they are
+        pass
+
+    return _encode_file_base64(path)
+
+
+def _encode_file_base64(path: Path) -> str:
+    """Base64-encode a file's contents.
+
+    The file is memory-mapped, so the encoder reads pages straight from the
+    OS cache instead of from a full bytes copy of the image.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The file content as a base64 string
+    """
+    with open(path, "rb") as f:
+        # mmap rejects empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return base64.standard_b64encode(mapped).decode("ascii")
+
+
 def extract_text_from_image(image_path: Path, api_key: str | None = None) -> str:
     """Extract text from an image of handwritten notes using Claude's vision API.
 
@@ -62,9 +128,6 @@ def extract_text_from_image(image_path: Path, api_key: str | None = None) -> str
         **config
     )
 
-    # Read and encode the image
-    image_data = base64.standard_b64encode(image_path.read_bytes()).decode("utf-8")
-
     # Determine media type based on file extension
     suffix = image_path.suffix.lower()
     media_type = MEDIA_TYPE_MAP.get(suffix)
@@ -74,6 +137,9 @@ def extract_text_from_image(image_path: Path, api_key: str | None = None) -> str
             f"Supported formats: {', '.join(sorted(IMAGE_EXTENSIONS))}"
         )
 
+    # Read and encode the image, downscaling oversized scans
+    image_data = _encode_image_base64(image_path)
+
     # Create message with image content
     message = HumanMessage(
         content=[
@@ -131,6 +197,7 @@ def extract_text_from_pdf(pdf_path: Path, api_key: str | None = None) -> str:
     extracted_texts = []
     for page_num, image in enumerate(images, start=1):
         # Convert PIL Image to bytes and then to base64
+        image.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION), Image.Resampling.LANCZOS)
         image_bytes = io.BytesIO()
         image.save(image_bytes, format="PNG")
         image_data = base64.standard_b64encode(image_bytes.getvalue()).decode("utf-8")
@@ -4,6 +4,8 @@ LangChain prompt templates for task analysis.
 These templates support dynamic variable injection for dates and other metadata.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 DAILY_SYSTEM_PROMPT = """\
@@ -741,6 +743,8 @@ Another Category
 Extract all visible text from the image now, maintaining the exact structure shown."""
 
 
+# Each getter builds its template once; callers share it and must not mutate it
+@lru_cache(maxsize=1)
 def get_daily_prompt() -> ChatPromptTemplate:
     """Get the daily retrospective analysis prompt template.
 
@@ -757,6 +761,7 @@ def get_daily_prompt() -> ChatPromptTemplate:
     ])
 
 
+@lru_cache(maxsize=1)
 def get_weekly_prompt() -> ChatPromptTemplate:
     """Get the weekly analysis prompt template.
 
@@ -774,6 +779,7 @@ def get_weekly_prompt() -> ChatPromptTemplate:
     ])
 
 
+@lru_cache(maxsize=1)
 def get_monthly_prompt() -> ChatPromptTemplate:
     """Get the monthly analysis prompt template.
 
@@ -791,6 +797,7 @@ def get_monthly_prompt() -> ChatPromptTemplate:
     ])
 
 
+@lru_cache(maxsize=1)
 def get_annual_prompt() -> ChatPromptTemplate:
     """Get the annual analysis prompt template.
 
@@ -4,12 +4,67 @@ Shared pytest fixtures for Tasker tests.
 
 import os
 import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+# Minimal valid 1x1 PNG file
+MINIMAL_PNG = bytes([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
+    0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
+    0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
+    0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
+    0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
+    0x54, 0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F,
+    0x00, 0x05, 0xFE, 0x02, 0xFE, 0xDC, 0xCC, 0x59,
+    0xE7, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,  # IEND chunk
+    0x44, 0xAE, 0x42, 0x60, 0x82
+])
+
+
+def pytest_configure(config):
+    """Import tasktriage and its Google/LangChain dependencies up front.
+
+    The first test otherwise pays for these imports, which skews its timing.
+    """
+    try:
+        import tasktriage.files  # noqa: F401
+        import tasktriage.gdrive  # noqa: F401
+    except ValueError as exc:
+        # config.py refuses to import without a configured notes source
+        raise pytest.UsageError(str(exc)) from exc
+
+
+def _mkfile(path: Path, data: str | bytes) -> Path:
+    """Write str or bytes to a file with a single os.open/os.write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data if isinstance(data, bytes) else data.encode("utf-8"))
+    finally:
+        os.close(fd)
+    return path
+
+
+@pytest.fixture
+def mkfile():
+    """Return a helper that writes str or bytes content to a file path."""
+    return _mkfile
+
+
+def _seed_raw_notes(directory: Path, timestamp: str, text: str) -> Path:
+    """Write the {timestamp}.raw_notes.txt file Sync creates for visual notes."""
+    return _mkfile(directory / f"{timestamp}.raw_notes.txt", text)
+
+
+@pytest.fixture
+def seed_raw_notes():
+    """Return a helper that seeds a raw_notes.txt file for a timestamp."""
+    return _seed_raw_notes
+
 
 @pytest.fixture
 def temp_dir():
@@ -18,18 +73,28 @@ def temp_dir():
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def _usb_root(tmp_path_factory):
+    """Create one session-wide root that per-test USB directories live under."""
+    return tmp_path_factory.mktemp("usb")
+
+
 @pytest.fixture
-def mock_usb_dir(temp_dir):
+def mock_usb_dir(_usb_root):
     """Create a mock USB directory structure with analysis subdirectories."""
-    daily_dir = temp_dir / "daily"
-    weekly_dir = temp_dir / "weekly"
-    monthly_dir = temp_dir / "monthly"
-    annual_dir = temp_dir / "annual"
-    daily_dir.mkdir()
-    weekly_dir.mkdir()
-    monthly_dir.mkdir()
-    annual_dir.mkdir()
-    return temp_dir
+    usb_dir = _usb_root / uuid.uuid4().hex
+    for subdir in ("daily", "weekly", "monthly", "annual"):
+        (usb_dir / subdir).mkdir(parents=True)
+    return usb_dir
+
+
+@pytest.fixture
+def usb_source(monkeypatch, mock_usb_dir):
+    """Point tasktriage.files at mock_usb_dir as the active USB input source."""
+    monkeypatch.setattr("tasktriage.files.get_all_input_directories", lambda: [mock_usb_dir])
+    monkeypatch.setattr("tasktriage.files.get_primary_input_directory", lambda: mock_usb_dir)
+    monkeypatch.setattr("tasktriage.files.get_active_source", lambda: "usb")
+    return mock_usb_dir
 
 
 @pytest.fixture
@@ -45,27 +110,21 @@ Home
     Grocery shopping
     Clean garage X
 """
-    notes_path.write_text(notes_content)
+    _mkfile(notes_path, notes_content)
     return notes_path
 
 
+@pytest.fixture(scope="session")
+def minimal_png_file(tmp_path_factory):
+    """Write the minimal PNG once per session; tests must only read it."""
+    return _mkfile(tmp_path_factory.mktemp("png") / "test_notes.png", MINIMAL_PNG)
+
+
 @pytest.fixture
 def sample_image_file(mock_usb_dir):
     """Create a sample PNG file (minimal valid PNG) at the top level."""
     image_path = mock_usb_dir / "20251230_090000.png"
-    # Minimal valid 1x1 PNG file
-    png_data = bytes([
-        0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-        0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,  # IHDR chunk
-        0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-        0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-        0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,  # IDAT chunk
-        0x54, 0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F,
-        0x00, 0x05, 0xFE, 0x02, 0xFE, 0xDC, 0xCC, 0x59,
-        0xE7, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,  # IEND chunk
-        0x44, 0xAE, 0x42, 0x60, 0x82
-    ])
-    image_path.write_bytes(png_data)
+    _mkfile(image_path, MINIMAL_PNG)
     return image_path
 
 
@@ -90,7 +149,7 @@ def sample_analysis_file(mock_usb_dir):
 ## Critical Assessment
 Tasks were well-defined and achievable.
 """
-    analysis_path.write_text(analysis_content)
+    _mkfile(analysis_path, analysis_content)
     return analysis_path
 
 
@@ -105,11 +164,16 @@ def mock_env_vars(temp_dir, monkeypatch):
     }
 
 
+@pytest.fixture(scope="session")
+def credentials_file(tmp_path_factory):
+    """Write one placeholder credentials.json shared by the whole session."""
+    return _mkfile(tmp_path_factory.mktemp("gdrive") / "credentials.json", '{"type": "service_account"}')
+
+
 @pytest.fixture
-def mock_gdrive_env_vars(temp_dir, monkeypatch):
+def mock_gdrive_env_vars(credentials_file, monkeypatch):
     """Set up mock Google Drive environment variables."""
-    credentials_path = temp_dir / "credentials.json"
-    credentials_path.write_text('{"type": "service_account"}')
+    credentials_path = credentials_file
 
     monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", str(credentials_path))
     monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id-12345")
@@ -121,10 +185,54 @@ def mock_gdrive_env_vars(temp_dir, monkeypatch):
     }
 
 
+@pytest.fixture
+def gdrive_mock():
+    """Create a pre-wired mock GoogleDriveClient.
+
+    Defaults to an empty folder where no files exist; tests override only
+    the return values they care about.
+    """
+    from tasktriage.gdrive import GoogleDriveClient
+
+    mock_client = Mock(spec=GoogleDriveClient)
+    mock_client.list_notes_files.return_value = []
+    # iter_notes_files streams whatever list_notes_files is set to return
+    mock_client.iter_notes_files.side_effect = lambda *args, **kwargs: iter(
+        mock_client.list_notes_files.return_value
+    )
+    mock_client.file_exists.return_value = False
+    mock_client.file_exists_many.side_effect = lambda subfolder_name, filenames: dict.fromkeys(filenames, False)
+    # Checksum comparison against local copies runs for real
+    mock_client.read_local_copy.side_effect = GoogleDriveClient.read_local_copy
+
+    # Uploads are recorded as (subfolder_name, filename, content) tuples
+    uploads = []
+
+    def upload_file(subfolder_name, filename, content):
+        uploads.append((subfolder_name, filename, content))
+        return f"uploaded-{filename}"
+
+    mock_client.upload_file = upload_file
+    mock_client.uploads = uploads
+    return mock_client
+
+
+@pytest.fixture
+def gdrive_source(monkeypatch, gdrive_mock):
+    """Make Google Drive the active source, backed by gdrive_mock.
+
+    LOCAL_OUTPUT_DIR is unset; tests that need local raw notes set it.
+    """
+    monkeypatch.setattr("tasktriage.files.GoogleDriveClient", lambda *args, **kwargs: gdrive_mock)
+    monkeypatch.setattr("tasktriage.files.get_active_source", lambda: "gdrive")
+    monkeypatch.setattr("tasktriage.config.LOCAL_OUTPUT_DIR", None)
+    return gdrive_mock
+
+
 @pytest.fixture
 def mock_llm_response():
     """Create a mock LLM response."""
-    mock_response = MagicMock()
+    mock_response = SimpleNamespace()
     mock_response.content = """# Daily Execution Order
 
 1. **Review Q4 budget proposal** [Energy: High] [Est: 45min]
@@ -156,12 +264,72 @@ def sample_datetime():
 
 
 @pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze datetime.now() in tasktriage.files at Wednesday, January 7, 2026 noon."""
+    fake_now = datetime(2026, 1, 7, 12, 0, 0)
+
+    class FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fake_now
+
+    monkeypatch.setattr("tasktriage.files.datetime", FrozenDateTime)
+    return fake_now
+
+
+@pytest.fixture(scope="session")
+def daily_prompt():
+    """Build the daily ChatPromptTemplate once per session; tests must not mutate it."""
+    from tasktriage.prompts import get_daily_prompt
+
+    return get_daily_prompt()
+
+
+@pytest.fixture(scope="session")
+def weekly_prompt():
+    """Build the weekly ChatPromptTemplate once per session; tests must not mutate it."""
+    from tasktriage.prompts import get_weekly_prompt
+
+    return get_weekly_prompt()
+
+
+@pytest.fixture(scope="session")
+def monthly_prompt():
+    """Build the monthly ChatPromptTemplate once per session; tests must not mutate it."""
+    from tasktriage.prompts import get_monthly_prompt
+
+    return get_monthly_prompt()
+
+
+@pytest.fixture(scope="session")
+def sample_daily_notes():
+    """Return raw daily notes text for formatting the daily prompt."""
+    return "Work\n    Task 1\n    Task 2"
+
+
+@pytest.fixture(scope="session")
+def sample_weekly_notes():
+    """Return combined daily analyses text for formatting the weekly prompt."""
+    return "## Monday\n\nTask analysis..."
+
+
+@pytest.fixture(scope="session")
+def sample_monthly_notes():
+    """Return combined weekly analyses text for formatting the monthly prompt."""
+    return "## Week 1\n\nWeekly analysis..."
+
+
+@pytest.fixture(scope="session")
 def example_text_file():
     """Return path to example text file."""
-    return Path(__file__).parent / "examples" / "20251225_074353.txt"
+    path = Path(__file__).parent / "examples" / "20251225_074353.txt"
+    assert path.exists(), path
+    return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def example_image_file():
     """Return path to example image file."""
-    return Path(__file__).parent / "examples" / "20251225_074353_Page_1.png"
+    path = Path(__file__).parent / "examples" / "20251225_074353_Page_1.png"
+    assert path.exists(), path
+    return path
@@ -275,7 +275,8 @@ class TestExampleFilesIntegration:
         content = example_text_file.read_text()
         assert len(content) > 0
         # Example file contains task categories
-        assert "agents team" in content.lower() or "admin" in content.lower()
+        content_lower = content.lower()
+        assert any(category in content_lower for category in ("agents team", "admin"))
 
     def test_example_image_file_is_valid_png(self, example_image_file):
         """Example image file should be a valid PNG."""
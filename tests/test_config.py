@@ -2,13 +2,10 @@
 Tests for tasktriage.config module.
 """
 
-import os
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import importlib
+from unittest.mock import patch
 
 import pytest
-import yaml
 
 
 class TestFetchApiKey:
@@ -55,18 +52,17 @@ class TestLoadModelConfig:
         finally:
             tasktriage.config.CONFIG_PATH = original_path
 
-    def test_loads_config_from_yaml(self, temp_dir):
+    def test_loads_config_from_yaml(self, temp_dir, mkfile):
         """Should load and return configuration from YAML file."""
         import tasktriage.config
 
         config_path = temp_dir / "config.yaml"
-        config_data = {
-            "model": "claude-sonnet-4-20250514",
-            "temperature": 0.5,
-            "max_tokens": 2048,
-        }
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
+        mkfile(
+            config_path,
+            "model: claude-sonnet-4-20250514\n"
+            "temperature: 0.5\n"
+            "max_tokens: 2048\n"
+        )
 
         # Save original and patch
         original_path = tasktriage.config.CONFIG_PATH
@@ -85,7 +81,7 @@ class TestLoadModelConfig:
         import tasktriage.config
 
         config_path = temp_dir / "config.yaml"
-        config_path.write_text("")
+        config_path.touch()
 
         # Save original and patch
         original_path = tasktriage.config.CONFIG_PATH
@@ -137,6 +133,21 @@ class TestIsUsbAvailable:
         finally:
             tasktriage.config.EXTERNAL_INPUT_DIR = original
 
+    def test_returns_false_when_usb_dir_is_a_file(self, temp_dir):
+        """Should return False when EXTERNAL_INPUT_DIR points to a regular file."""
+        import tasktriage.config
+
+        file_path = temp_dir / "not_a_dir.txt"
+        file_path.touch()
+
+        original = tasktriage.config.EXTERNAL_INPUT_DIR
+        try:
+            tasktriage.config.EXTERNAL_INPUT_DIR = str(file_path)
+            result = tasktriage.config.is_usb_available()
+            assert result is False
+        finally:
+            tasktriage.config.EXTERNAL_INPUT_DIR = original
+
 
 class TestIsGdriveAvailable:
     """Tests for is_gdrive_available function (OAuth-based)."""
@@ -227,11 +238,8 @@ class TestGetActiveSource:
             result = tasktriage.config.get_active_source()
             assert result == "usb"
 
-    def test_returns_gdrive_when_notes_source_is_gdrive(self, temp_dir):
+    def test_returns_gdrive_when_notes_source_is_gdrive(self, credentials_file):
         """Should return 'gdrive' when NOTES_SOURCE is 'gdrive' and GDrive is available."""
-        credentials_path = temp_dir / "credentials.json"
-        credentials_path.write_text('{"type": "service_account"}')
-
         with patch("tasktriage.config.NOTES_SOURCE", "gdrive"), \
              patch("tasktriage.config.is_gdrive_available", return_value=True):
             import tasktriage.config
@@ -292,3 +300,31 @@ class TestGetActiveSource:
 
             with pytest.raises(ValueError, match="No notes source available"):
                 tasktriage.config.get_active_source()
+
+
+class TestImageMaxDimension:
+    """Tests for the TASKTRIAGE_IMAGE_MAX_DIM setting."""
+
+    @pytest.mark.parametrize("value", ["large", "0", "-5", "", "²", "12.5"])
+    def test_invalid_value_raises_clear_error(self, monkeypatch, value):
+        """Should name the variable and the bad value instead of a bare int() error."""
+        import tasktriage.config
+
+        monkeypatch.setenv("TASKTRIAGE_IMAGE_MAX_DIM", value)
+        try:
+            with pytest.raises(ValueError, match="TASKTRIAGE_IMAGE_MAX_DIM must be a positive whole number"):
+                importlib.reload(tasktriage.config)
+        finally:
+            monkeypatch.undo()
+            importlib.reload(tasktriage.config)
+
+    def test_reads_value_from_environment(self, monkeypatch):
+        """Should use the configured dimension when it is a positive integer."""
+        import tasktriage.config
+
+        monkeypatch.setenv("TASKTRIAGE_IMAGE_MAX_DIM", "1024")
+        try:
+            assert importlib.reload(tasktriage.config).IMAGE_MAX_DIMENSION == 1024
+        finally:
+            monkeypatch.undo()
+            importlib.reload(tasktriage.config)
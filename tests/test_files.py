@@ -2,291 +2,269 @@
 Tests for tasktriage.files module.
 """
 
+import hashlib
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from tasktriage.files import (
+    ALL_EXTENSIONS,
+    TEXT_EXTENSIONS,
+    _collect_weekly_analyses_gdrive_for_week,
+    _extract_timestamp,
+    _find_weeks_needing_analysis,
+    _save_analysis_gdrive,
+    load_all_unanalyzed_task_notes,
+    load_task_notes,
+    save_analysis,
+)
+from tasktriage.gdrive import parse_filename_datetime
+from tasktriage.image import IMAGE_EXTENSIONS
+
+# Parsed timestamps of the notes filenames used throughout these tests
+DT_20251225_073454 = datetime(2025, 12, 25, 7, 34, 54)
+DT_20251225_074353 = datetime(2025, 12, 25, 7, 43, 53)
+DT_20251227_090000 = datetime(2025, 12, 27, 9, 0, 0)
+DT_20251228_100000 = datetime(2025, 12, 28, 10, 0, 0)
+DT_20251231_143000 = datetime(2025, 12, 31, 14, 30, 0)
+
+# Virtual Drive paths (Path normalizes gdrive:// to gdrive:/)
+GDRIVE_TXT = Path("gdrive://daily/20251231_143000.txt")
+GDRIVE_PNG_PAGE = Path("gdrive://daily/20251228_100000_Page_1.png")
+
+
+def _is_gdrive(path: Path) -> bool:
+    """Return True for virtual Drive paths (normalized to gdrive:/ by Path)."""
+    return path.as_posix().startswith("gdrive:/")
+
 
 class TestLoadTaskNotesUsb:
     """Tests for loading task notes from USB/local directory."""
 
-    def test_loads_text_file(self, mock_usb_dir, sample_notes_file):
+    def test_loads_text_file(self, usb_source, sample_notes_file):
         """Should load content from a text file."""
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
+        content, path, file_date = load_task_notes("daily", "txt")
 
-            content, path, file_date = load_task_notes("daily", "txt")
+        assert "Review Q4 budget proposal" in content
+        assert path == sample_notes_file
+        assert file_date == DT_20251231_143000
 
-            assert "Review Q4 budget proposal" in content
-            assert path == sample_notes_file
-            assert file_date == datetime(2025, 12, 31, 14, 30, 0)
-
-    def test_loads_png_file_with_text_extraction(self, mock_usb_dir, sample_image_file):
+    def test_loads_png_file_with_text_extraction(self, mock_usb_dir, usb_source, sample_image_file, seed_raw_notes):
         """Should load text from raw_notes.txt for PNG files."""
         # Create the raw_notes.txt file that Sync would create
-        raw_notes_path = mock_usb_dir / "20251230_090000.raw_notes.txt"
-        raw_notes_path.write_text("Extracted task notes")
+        seed_raw_notes(mock_usb_dir, "20251230_090000", "Extracted task notes")
 
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
+        content, path, file_date = load_task_notes("daily", "png")
 
-            content, path, file_date = load_task_notes("daily", "png")
+        assert content == "Extracted task notes"
+        assert path == sample_image_file
 
-            assert content == "Extracted task notes"
-            assert path == sample_image_file
-
-    def test_skips_analysis_files(self, mock_usb_dir, sample_analysis_file):
-        """Should skip files that are already analysis files."""
+    def test_skips_analysis_files(self, mock_usb_dir, usb_source, sample_analysis_file, mkfile):
+        """Should skip analysis files by name, before any timestamp parsing."""
         # Create a notes file at the top level
         notes_path = mock_usb_dir / "20251228_100000.txt"
-        notes_path.write_text("Some tasks")
-
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
+        mkfile(notes_path, "Some tasks")
 
-            content, path, file_date = load_task_notes("daily", "txt")
+        content, path, file_date = load_task_notes("daily", "txt")
 
-            # Should load the notes file, not the analysis file
-            assert "Some tasks" in content
-            assert ".triaged." not in path.name and "_analysis" not in path.name
+        # Should load the notes file, not the analysis file
+        assert "Some tasks" in content
+        assert ".triaged." not in path.name and "_analysis" not in path.name
 
-    def test_skips_files_with_existing_analysis(self, mock_usb_dir):
+    def test_skips_files_with_existing_analysis(self, mock_usb_dir, usb_source, mkfile):
         """Should skip notes files that already have an analysis file."""
         daily_dir = mock_usb_dir / "daily"
 
         # Create a notes file with existing analysis at the top level
         notes_with_analysis = mock_usb_dir / "20251231_143000.txt"
-        notes_with_analysis.write_text("Old tasks")
+        mkfile(notes_with_analysis, "Old tasks")
         # Analysis file goes to daily subdirectory (new naming: DD_MM_YYYY.triaged.txt)
         analysis_file = daily_dir / "31_12_2025.triaged.txt"
-        analysis_file.write_text("Analysis exists")
+        analysis_file.touch()
 
         # Create a newer notes file without analysis at the top level
         newer_notes = mock_usb_dir / "20251230_090000.txt"
-        newer_notes.write_text("Newer tasks")
+        mkfile(newer_notes, "Newer tasks")
 
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
-
-            content, path, file_date = load_task_notes("daily", "txt")
+        content, path, file_date = load_task_notes("daily", "txt")
 
-            # Should load the file without analysis (even though it's older by name)
-            assert "Newer tasks" in content
+        # Should load the file without analysis (even though it's older by name)
+        assert "Newer tasks" in content
 
-    def test_raises_when_directory_not_found(self, mock_usb_dir):
+    def test_raises_when_directory_not_found(self):
         """Should raise FileNotFoundError when directory doesn't exist."""
         with patch("tasktriage.files.get_all_input_directories", return_value=[]), \
              patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
-
             with pytest.raises(FileNotFoundError, match="No input directories"):
                 load_task_notes("daily")
 
-    def test_raises_when_no_unanalyzed_files(self, mock_usb_dir):
+    def test_raises_when_no_unanalyzed_files(self, mock_usb_dir, usb_source):
         """Should raise FileNotFoundError when all files are analyzed."""
         daily_dir = mock_usb_dir / "daily"
         # Create only an analysis file in daily subdirectory (new naming)
         analysis = daily_dir / "31_12_2025.triaged.txt"
-        analysis.write_text("Analysis content")
+        analysis.touch()
 
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
+        with pytest.raises(FileNotFoundError, match="No unanalyzed"):
+            load_task_notes("daily")
 
-            with pytest.raises(FileNotFoundError, match="No unanalyzed"):
-                load_task_notes("daily")
+    def test_rescans_after_saving_analysis(self, usb_source, sample_notes_file):
+        """Should not return a notes file again once its analysis has been saved."""
+        content, path, file_date = load_task_notes("daily", "txt")
+        save_analysis("Analysis", path, "daily")
+
+        with pytest.raises(FileNotFoundError, match="No unanalyzed"):
+            load_task_notes("daily", "txt")
+
+    def test_sees_file_written_within_same_mtime_tick(self, mock_usb_dir, usb_source, sample_notes_file, mkfile):
+        """A file added without changing the directory mtime should still be found."""
+        load_task_notes("daily", "txt")
+        dir_stat = mock_usb_dir.stat()
+
+        mkfile(mock_usb_dir / "20260101_090000.txt", "Just synced")
+        # Coarse-mtime filesystems (FAT) can leave the directory mtime unchanged
+        os.utime(mock_usb_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        content, path, file_date = load_task_notes("daily", "txt")
+
+        assert "Just synced" in content
+
+    def test_scan_does_not_stat_files(self, usb_source, sample_notes_file, sample_image_file):
+        """Should list candidates from the directory scan without stat-ing each file."""
+        real_stat = os.stat
+        with patch("os.stat", side_effect=real_stat) as mock_stat:
+            load_task_notes("daily", "txt")
+
+        stat_paths = {os.fspath(call.args[0]) for call in mock_stat.call_args_list}
+        assert os.fspath(sample_notes_file) not in stat_paths
+        assert os.fspath(sample_image_file) not in stat_paths
 
 
 class TestLoadTaskNotesGdrive:
     """Tests for loading task notes from Google Drive."""
 
-    def test_loads_text_file_from_gdrive(self):
+    def test_loads_text_file_from_gdrive(self, gdrive_source):
         """Should load text file content from Google Drive."""
-        mock_client = MagicMock()
-        mock_client.list_notes_files.return_value = [
+        gdrive_source.list_notes_files.return_value = [
             {"id": "file1", "name": "20251231_143000.txt", "mimeType": "text/plain"}
         ]
-        mock_client.file_exists.return_value = False
-        mock_client.download_file_text.return_value = "GDrive task content"
-
-        # Mock LOCAL_OUTPUT_DIR in config module
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", None), \
-             patch("tasktriage.files.get_active_source", return_value="gdrive"), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import load_task_notes
+        gdrive_source.download_file_text.return_value = "GDrive task content"
 
-            content, path, file_date = load_task_notes("daily", "txt")
+        content, path, file_date = load_task_notes("daily", "txt")
 
-            assert content == "GDrive task content"
-            assert "gdrive:" in str(path)  # Path normalizes gdrive:// to gdrive:/
-            assert file_date == datetime(2025, 12, 31, 14, 30, 0)
+        assert content == "GDrive task content"
+        assert _is_gdrive(path)
+        assert file_date == DT_20251231_143000
 
-    def test_extracts_text_from_png_in_gdrive(self, temp_dir):
+    def test_extracts_text_from_png_in_gdrive(self, mock_usb_dir, gdrive_source, monkeypatch, seed_raw_notes):
         """Should load text from raw_notes.txt for PNG files in Google Drive."""
         # Create the raw_notes.txt file that Sync would create
-        raw_notes_path = temp_dir / "20251230_090000.raw_notes.txt"
-        raw_notes_path.write_text("Extracted from GDrive image")
+        seed_raw_notes(mock_usb_dir, "20251230_090000", "Extracted from GDrive image")
+        monkeypatch.setattr("tasktriage.config.LOCAL_OUTPUT_DIR", str(mock_usb_dir))
 
-        mock_client = MagicMock()
-        mock_client.list_notes_files.return_value = [
+        gdrive_source.list_notes_files.return_value = [
             {"id": "file1", "name": "20251230_090000.png", "mimeType": "image/png"}
         ]
-        mock_client.file_exists.return_value = False
-
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", str(temp_dir)), \
-             patch("tasktriage.files.get_active_source", return_value="gdrive"), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import load_task_notes
 
-            content, path, file_date = load_task_notes("daily", "png")
+        content, path, file_date = load_task_notes("daily", "png")
 
-            assert content == "Extracted from GDrive image"
+        assert content == "Extracted from GDrive image"
 
-    def test_loads_png_with_page_identifier_from_gdrive(self, temp_dir):
+    def test_loads_png_with_page_identifier_from_gdrive(self, mock_usb_dir, gdrive_source, monkeypatch, seed_raw_notes):
         """Should load PNG file with page identifier from Google Drive."""
         # Create the raw_notes.txt file that Sync would create (uses base timestamp without page)
-        raw_notes_path = temp_dir / "20251225_073454.raw_notes.txt"
-        raw_notes_path.write_text("Extracted from page 1")
+        seed_raw_notes(mock_usb_dir, "20251225_073454", "Extracted from page 1")
+        monkeypatch.setattr("tasktriage.config.LOCAL_OUTPUT_DIR", str(mock_usb_dir))
 
-        mock_client = MagicMock()
-        mock_client.list_notes_files.return_value = [
+        gdrive_source.list_notes_files.return_value = [
             {"id": "file1", "name": "20251225_073454_Page_1.png", "mimeType": "image/png"}
         ]
-        mock_client.file_exists.return_value = False
 
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", str(temp_dir)), \
-             patch("tasktriage.files.get_active_source", return_value="gdrive"), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import load_task_notes
+        content, path, file_date = load_task_notes("daily", "png")
 
-            content, path, file_date = load_task_notes("daily", "png")
+        assert content == "Extracted from page 1"
+        assert file_date == DT_20251225_073454
 
-            assert content == "Extracted from page 1"
-            assert file_date == datetime(2025, 12, 25, 7, 34, 54)
-
-    def test_skips_gdrive_page_file_with_existing_analysis(self):
-        """Should skip GDrive page file when analysis exists for that timestamp."""
-        mock_client = MagicMock()
-        mock_client.list_notes_files.return_value = [
-            {"id": "file1", "name": "20251228_100000_Page_1.png", "mimeType": "image/png"},
-            {"id": "file2", "name": "20251227_090000.txt", "mimeType": "text/plain"},
+    def test_checks_analysis_by_timestamp_not_full_filename_gdrive(self, gdrive_source):
+        """Should skip a page file whose date-based analysis is already in the Drive listing."""
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "analysis", "name": "28_12_2025.triaged.txt", "mimeType": "text/plain"},
+            {"id": "page", "name": "20251228_100000_Page_1.txt", "mimeType": "text/plain"},
+            {"id": "fresh", "name": "20251227_100000.txt", "mimeType": "text/plain"},
         ]
-        # Analysis exists for first file's date (new naming: DD_MM_YYYY.triaged.txt)
-        def file_exists_side_effect(subfolder, filename):
-            return filename == "28_12_2025.triaged.txt"
-
-        mock_client.file_exists.side_effect = file_exists_side_effect
-        mock_client.download_file_text.return_value = "Older notes from text file"
-
-        with patch("tasktriage.files.get_active_source", return_value="gdrive"), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import load_task_notes
-
-            content, path, file_date = load_task_notes("daily", "txt")
-
-            # Should load the second file since first file's timestamp has analysis
-            assert content == "Older notes from text file"
-            assert file_date == datetime(2025, 12, 27, 9, 0, 0)
-
-    def test_checks_analysis_by_timestamp_not_full_filename_gdrive(self, temp_dir):
-        """Should check for analysis using date format, not full filename with page identifier."""
-        # Create the raw_notes.txt file that Sync would create
-        raw_notes_path = temp_dir / "20251228_100000.raw_notes.txt"
-        raw_notes_path.write_text("Extracted text")
-
-        mock_client = MagicMock()
-        mock_client.list_notes_files.return_value = [
-            {"id": "file1", "name": "20251228_100000_Page_1.png", "mimeType": "image/png"},
+        gdrive_source.download_file_text.return_value = "Unanalyzed notes"
+
+        content, path, file_date = load_task_notes("daily", "txt")
+
+        # The page file maps to 28_12_2025.triaged.txt, so the next file is loaded
+        gdrive_source.download_file_text.assert_called_once_with("fresh")
+        assert file_date == datetime(2025, 12, 27, 10, 0, 0)
+        # Existing analyses are resolved from the folder listing, not per-file lookups
+        gdrive_source.list_notes_files.assert_called_once_with("daily")
+        gdrive_source.file_exists.assert_not_called()
+
+    def test_load_all_skips_page_file_with_gdrive_analysis(self, gdrive_source):
+        """Loading every unanalyzed file should also skip pages analyzed on Drive."""
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "analysis", "name": "28_12_2025.triaged.txt", "mimeType": "text/plain"},
+            {"id": "page", "name": "20251228_100000_Page_1.txt", "mimeType": "text/plain"},
+            {"id": "fresh", "name": "20251227_100000.txt", "mimeType": "text/plain"},
         ]
-        mock_client.file_exists.return_value = False
-
-        # When LOCAL_OUTPUT_DIR is not set, file_exists is called on GDrive
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", None), \
-             patch("tasktriage.files.get_active_source", return_value="gdrive"), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import load_task_notes
+        gdrive_source.download_file_text.return_value = "Unanalyzed notes"
 
-            # This should raise because visual files require raw_notes.txt from Sync
-            # and LOCAL_OUTPUT_DIR is None so we can't find the raw_notes file
-            with pytest.raises(FileNotFoundError):
-                load_task_notes("daily", "png")
+        results = load_all_unanalyzed_task_notes("daily", "txt")
 
-            # Verify file_exists was called with date-based analysis filename (DD_MM_YYYY.triaged.txt)
-            mock_client.file_exists.assert_called_with(
-                "daily", "28_12_2025.triaged.txt"
-            )
+        assert [file_date for _, _, file_date in results] == [datetime(2025, 12, 27, 10, 0, 0)]
+        gdrive_source.download_file_text.assert_called_once_with("fresh")
 
 
 class TestSaveAnalysis:
     """Tests for saving analysis files."""
 
-    def test_saves_analysis_to_usb(self, mock_usb_dir, sample_notes_file):
-        """Should save analysis file next to the input file."""
-        from tasktriage.files import save_analysis
+    def test_saves_analysis_to_usb(self, sample_notes_file):
+        """Should save a formatted .triaged.txt analysis for the input file."""
+        output_path = save_analysis("# Daily Execution Order\n\n1. Task one", sample_notes_file, "daily")
 
-        analysis_content = "# Daily Execution Order\n\n1. Task one"
-
-        with patch("tasktriage.files.get_primary_input_directory", return_value=mock_usb_dir):
-            output_path = save_analysis(analysis_content, sample_notes_file, "daily")
-
-            assert output_path.exists()
-            assert ".triaged." in output_path.name
-            content = output_path.read_text()
-            assert "Triaged Tasks" in content
-            assert "Task one" in content
+        assert output_path.suffix == ".txt"
+        assert ".triaged." in output_path.name
+        # A single read both proves the file exists and supplies the content
+        content = output_path.read_text()
+        assert "Triaged Tasks" in content
+        assert "=" * 40 in content
+        assert "Task one" in content
 
-    def test_saves_analysis_to_gdrive(self, mock_usb_dir):
+    def test_saves_analysis_to_gdrive(self, gdrive_source):
         """Should upload analysis to Google Drive for gdrive:// paths."""
-        mock_client = MagicMock()
-
-        # Mock LOCAL_OUTPUT_DIR in config module, not files module
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", None), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import _save_analysis_gdrive
+        # Test the gdrive function directly since Path normalizes gdrive://
+        virtual_path = GDRIVE_TXT
+        analysis_content = "Analysis content"
 
-            # Test the gdrive function directly since Path normalizes gdrive://
-            virtual_path = Path("gdrive://daily/20251231_143000.txt")
-            analysis_content = "Analysis content"
+        output_path = _save_analysis_gdrive(analysis_content, virtual_path, "daily")
 
-            output_path = _save_analysis_gdrive(analysis_content, virtual_path, "daily")
+        assert len(gdrive_source.uploads) == 1
+        assert _is_gdrive(output_path)
 
-            mock_client.upload_file.assert_called_once()
-            assert "gdrive:" in str(output_path)
-
-    def test_save_analysis_routes_to_gdrive_with_normalized_path(self):
+    def test_save_analysis_routes_to_gdrive_with_normalized_path(self, gdrive_source):
         """Should route to gdrive save when path is normalized (gdrive:/ not gdrive://)."""
-        mock_client = MagicMock()
-
-        # Mock LOCAL_OUTPUT_DIR in config module, not files module
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", None), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import save_analysis
-
-            # Path normalizes gdrive:// to gdrive:/ - this should still route to gdrive
-            virtual_path = Path("gdrive://daily/20251231_143000.txt")
-            # Verify the path was normalized
-            assert str(virtual_path).startswith("gdrive:/")
-            assert not str(virtual_path).startswith("gdrive://")
+        # Path normalizes gdrive:// to gdrive:/ - this should still route to gdrive
+        virtual_path = GDRIVE_TXT
+        # Verify the path was normalized
+        assert virtual_path.as_posix() == "gdrive:/daily/20251231_143000.txt"
 
-            output_path = save_analysis("Analysis content", virtual_path, "daily")
+        output_path = save_analysis("Analysis content", virtual_path, "daily")
 
-            # Should have called gdrive upload, not tried to write locally
-            mock_client.upload_file.assert_called_once()
-            assert "gdrive:" in str(output_path)
+        # Should have called gdrive upload, not tried to write locally
+        assert len(gdrive_source.uploads) == 1
+        assert _is_gdrive(output_path)
 
     def test_saves_analysis_with_page_identifier_usb(self, mock_usb_dir):
         """Should save analysis using date only (DD_MM_YYYY), not page identifier, for USB."""
         daily_dir = mock_usb_dir / "daily"
         page_file = daily_dir / "20251228_100000_Page_1.png"
-        page_file.write_bytes(b"fake png data")
-
-        from tasktriage.files import save_analysis
+        page_file.touch()
 
         output_path = save_analysis("Analysis content", page_file, "daily")
 
@@ -294,250 +272,241 @@ class TestSaveAnalysis:
         assert output_path.name == "28_12_2025.triaged.txt"
         assert "_Page_" not in output_path.name
 
-    def test_saves_analysis_with_page_identifier_gdrive(self):
+    def test_saves_analysis_with_page_identifier_gdrive(self, gdrive_source):
         """Should save analysis using date only (DD_MM_YYYY), not page identifier, for GDrive."""
-        mock_client = MagicMock()
-
-        # Mock LOCAL_OUTPUT_DIR in config module, not files module
-        with patch("tasktriage.config.LOCAL_OUTPUT_DIR", None), \
-             patch("tasktriage.gdrive.GoogleDriveClient", return_value=mock_client):
-            from tasktriage.files import _save_analysis_gdrive
-
-            virtual_path = Path("gdrive://daily/20251228_100000_Page_1.png")
-            analysis_content = "Analysis content"
-
-            output_path = _save_analysis_gdrive(analysis_content, virtual_path, "daily")
+        virtual_path = GDRIVE_PNG_PAGE
+        analysis_content = "Analysis content"
 
-            # Verify upload was called with date-based filename (DD_MM_YYYY.triaged.txt)
-            call_args = mock_client.upload_file.call_args
-            uploaded_filename = call_args[0][1]  # Second positional arg is filename
-            assert uploaded_filename == "28_12_2025.triaged.txt"
-            assert "_Page_" not in uploaded_filename
+        output_path = _save_analysis_gdrive(analysis_content, virtual_path, "daily")
 
-    def test_formats_output_with_header(self, mock_usb_dir, sample_notes_file):
-        """Should format output with proper header."""
-        from tasktriage.files import save_analysis
-
-        output_path = save_analysis("Content", sample_notes_file, "daily")
-
-        content = output_path.read_text()
-        assert "Triaged Tasks" in content
-        assert "=" * 40 in content
+        # Verify upload was called with date-based filename (DD_MM_YYYY.triaged.txt)
+        assert len(gdrive_source.uploads) == 1
+        subfolder, uploaded_filename, _ = gdrive_source.uploads[0]
+        assert subfolder == "daily"
+        assert uploaded_filename == "28_12_2025.triaged.txt"
+        assert "_Page_" not in uploaded_filename
 
     def test_always_saves_as_txt(self, mock_usb_dir):
         """Should always save as .txt regardless of input format."""
         png_input = mock_usb_dir / "20251230_090000.png"
-        png_input.write_bytes(b"fake png data")
-
-        from tasktriage.files import save_analysis
+        png_input.touch()
 
         output_path = save_analysis("Analysis", png_input, "daily")
 
         assert output_path.suffix == ".txt"
 
 
-class TestFileExtensionConstants:
-    """Tests for file extension constants."""
+class TestFindWeeksNeedingAnalysis:
+    """Tests for detecting work weeks that are ready for weekly analysis."""
 
-    def test_text_extensions_contains_txt(self):
-        """TEXT_EXTENSIONS should include .txt."""
-        from tasktriage.files import TEXT_EXTENSIONS
+    # Work week before the frozen "now" (Wednesday, January 7, 2026)
+    LAST_MONDAY = datetime(2025, 12, 29)
+    LAST_FRIDAY = datetime(2026, 1, 2, 23, 59, 59, 999999)
 
-        assert ".txt" in TEXT_EXTENSIONS
+    def test_includes_ended_week_with_analyses(self, usb_source, frozen_now):
+        """Should include a finished work week that has at least one daily analysis."""
+        (usb_source / "daily" / "29_12_2025.triaged.txt").touch()
 
-    def test_all_extensions_includes_both(self):
-        """ALL_EXTENSIONS should include both text and image extensions."""
-        from tasktriage.files import ALL_EXTENSIONS, TEXT_EXTENSIONS
-        from tasktriage.image import IMAGE_EXTENSIONS
-
-        assert TEXT_EXTENSIONS.issubset(ALL_EXTENSIONS)
-        assert IMAGE_EXTENSIONS.issubset(ALL_EXTENSIONS)
+        weeks = _find_weeks_needing_analysis()
 
+        assert weeks == [(self.LAST_MONDAY, self.LAST_FRIDAY)]
 
-class TestExtractTimestamp:
-    """Tests for _extract_timestamp helper function."""
+    def test_includes_ended_week_from_gdrive_listing(self, gdrive_source, frozen_now):
+        """Should stream the Drive daily listing and find the finished work week."""
+        gdrive_source.list_notes_files.return_value = [{"id": "mon", "name": "29_12_2025.triaged.txt"}]
 
-    def test_extracts_from_simple_filename(self):
-        """Should extract timestamp from simple filename."""
-        from tasktriage.files import _extract_timestamp
+        weeks = _find_weeks_needing_analysis()
 
-        result = _extract_timestamp("20251225_073454.txt")
-        assert result == "20251225_073454"
+        assert weeks == [(self.LAST_MONDAY, self.LAST_FRIDAY)]
+        gdrive_source.iter_notes_files.assert_called_once_with("daily")
 
-    def test_extracts_from_png_filename(self):
-        """Should extract timestamp from PNG filename."""
-        from tasktriage.files import _extract_timestamp
+    def test_skips_weeks_analyzed_in_gdrive_with_one_check(self, gdrive_source, frozen_now):
+        """Should check every candidate week's analysis in Drive with a single batched call."""
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "mon", "name": "29_12_2025.triaged.txt"},
+            {"id": "prev", "name": "22_12_2025.triaged.txt"},
+        ]
+        gdrive_source.file_exists_many.side_effect = None
+        gdrive_source.file_exists_many.return_value = {
+            "29_12_2025.triaged.txt": False,
+            "22_12_2025.triaged.txt": True,
+        }
 
-        result = _extract_timestamp("20251225_073454.png")
-        assert result == "20251225_073454"
+        weeks = _find_weeks_needing_analysis()
 
-    def test_extracts_from_page_identifier_filename(self):
-        """Should extract timestamp from filename with page identifier."""
-        from tasktriage.files import _extract_timestamp
+        assert weeks == [(self.LAST_MONDAY, self.LAST_FRIDAY)]
+        gdrive_source.file_exists_many.assert_called_once_with(
+            "weekly", ["29_12_2025.triaged.txt", "22_12_2025.triaged.txt"]
+        )
+        gdrive_source.file_exists.assert_not_called()
 
-        result = _extract_timestamp("20251225_073454_Page_1.png")
-        assert result == "20251225_073454"
+    def test_skips_current_week_in_progress(self, usb_source, frozen_now):
+        """Should not include the current work week before it has ended."""
+        (usb_source / "daily" / "05_01_2026.triaged.txt").touch()
+        (usb_source / "daily" / "06_01_2026.triaged.txt").touch()
 
-    def test_extracts_from_multi_digit_page(self):
-        """Should extract timestamp from filename with multi-digit page number."""
-        from tasktriage.files import _extract_timestamp
+        weeks = _find_weeks_needing_analysis()
 
-        result = _extract_timestamp("20251225_073454_Page_12.png")
-        assert result == "20251225_073454"
+        assert weeks == []
 
-    def test_returns_none_for_invalid_filename(self):
-        """Should return None for invalid filename."""
-        from tasktriage.files import _extract_timestamp
 
-        result = _extract_timestamp("invalid_filename.txt")
-        assert result is None
+class TestCollectWeeklyAnalysesGdrive:
+    """Tests for collecting a work week's daily analyses from Google Drive."""
 
-    def test_returns_none_for_analysis_filename(self):
-        """Should return None for analysis filename without proper timestamp."""
-        from tasktriage.files import _extract_timestamp
+    def test_downloads_week_in_one_concurrent_call(self, gdrive_source):
+        """Should fetch every in-week analysis through one download_many call."""
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "tue", "name": "30_12_2025.triaged.txt"},
+            {"id": "mon", "name": "29_12_2025.triaged.txt"},
+            {"id": "next", "name": "05_01_2026.triaged.txt"},
+            {"id": "notes", "name": "20251229_090000.txt"},
+        ]
+        gdrive_source.download_many.return_value = {"mon": b"Monday plan", "tue": b"Tuesday plan"}
+
+        text, _, _, _ = _collect_weekly_analyses_gdrive_for_week(
+            datetime(2025, 12, 29), datetime(2026, 1, 2, 23, 59, 59)
+        )
+
+        gdrive_source.download_many.assert_called_once_with(["mon", "tue"])
+        assert text.index("Monday plan") < text.index("Tuesday plan")
+
+    def test_reads_unchanged_local_copies_instead_of_downloading(self, gdrive_source, temp_dir, monkeypatch):
+        """Should skip downloading analyses whose local copy matches the Drive md5Checksum."""
+        monkeypatch.setattr("tasktriage.config.LOCAL_OUTPUT_DIR", str(temp_dir))
+        (temp_dir / "daily").mkdir()
+        monday_plan = "Monday plan ✓".encode("utf-8")
+        (temp_dir / "daily" / "29_12_2025.triaged.txt").write_bytes(monday_plan)
+        (temp_dir / "daily" / "30_12_2025.triaged.txt").write_text("Stale Tuesday plan")
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "mon", "name": "29_12_2025.triaged.txt",
+             "md5Checksum": hashlib.md5(monday_plan).hexdigest()},
+            {"id": "tue", "name": "30_12_2025.triaged.txt",
+             "md5Checksum": hashlib.md5(b"Tuesday plan").hexdigest()},
+        ]
+        gdrive_source.download_many.return_value = {"tue": b"Tuesday plan"}
 
-        # Analysis filenames have the format timestamp.daily_analysis.txt
-        # The stem is "timestamp.daily_analysis" which should still extract properly
-        result = _extract_timestamp("20251225_073454.daily_analysis.txt")
-        # The stem is "20251225_073454.daily_analysis" which has a dot
-        # After splitting, we'd check "20251225_073454.daily_analysis"
-        # But our function only looks at stem, not handling dots in stem
-        # Since stem="20251225_073454.daily_analysis" is not 15 chars, returns None
-        assert result is None
+        text, _, _, _ = _collect_weekly_analyses_gdrive_for_week(
+            datetime(2025, 12, 29), datetime(2026, 1, 2, 23, 59, 59)
+        )
 
+        gdrive_source.download_many.assert_called_once_with(["tue"])
+        # Decoded as UTF-8 like a download, whatever the locale encoding
+        assert "Monday plan ✓" in text
+        assert "Stale" not in text
 
-class TestExampleFiles:
-    """Tests using example files from tests/examples directory."""
 
-    def test_example_text_file_exists(self, example_text_file):
-        """Example text file should exist."""
-        assert example_text_file.exists()
-        assert example_text_file.suffix == ".txt"
+class TestFileExtensionConstants:
+    """Tests for file extension constants."""
 
-    def test_example_image_file_exists(self, example_image_file):
-        """Example image file should exist."""
-        assert example_image_file.exists()
-        assert example_image_file.suffix == ".png"
+    def test_text_extensions_contains_txt(self):
+        """TEXT_EXTENSIONS should include .txt."""
+        assert ".txt" in TEXT_EXTENSIONS
 
-    def test_example_text_file_parses_correctly(self, example_text_file):
-        """Example text file should parse with correct datetime."""
-        from tasktriage.gdrive import parse_filename_datetime
+    def test_all_extensions_includes_both(self):
+        """ALL_EXTENSIONS should include both text and image extensions."""
+        assert TEXT_EXTENSIONS.issubset(ALL_EXTENSIONS)
+        assert IMAGE_EXTENSIONS.issubset(ALL_EXTENSIONS)
 
-        result = parse_filename_datetime(example_text_file.name)
-        assert result == datetime(2025, 12, 25, 7, 43, 53)
 
-    def test_example_image_file_parses_correctly(self, example_image_file):
-        """Example image file with page identifier should parse correctly."""
-        from tasktriage.gdrive import parse_filename_datetime
+class TestExtractTimestamp:
+    """Tests for _extract_timestamp helper function."""
 
-        result = parse_filename_datetime(example_image_file.name)
-        assert result == datetime(2025, 12, 25, 7, 43, 53)
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            pytest.param("20251225_073454.txt", "20251225_073454", id="simple"),
+            pytest.param("20251225_073454.png", "20251225_073454", id="png"),
+            pytest.param("20251225_073454_Page_1.png", "20251225_073454", id="page"),
+            pytest.param("20251225_073454_Page_12.png", "20251225_073454", id="multi-digit-page"),
+            pytest.param("invalid_filename.txt", None, id="invalid"),
+            # The stem "20251225_073454.daily_analysis" is not a bare timestamp
+            pytest.param("20251225_073454.daily_analysis.txt", None, id="analysis"),
+            pytest.param("20251225_073454.raw_notes.txt", None, id="raw-notes"),
+            pytest.param("28_12_2025.triaged.txt", None, id="triaged"),
+        ],
+    )
+    def test_extract_timestamp(self, filename, expected):
+        """Should extract the timestamp prefix, or None when there is none."""
+        assert _extract_timestamp(filename) == expected
 
-    def test_example_files_have_matching_timestamps(self, example_text_file, example_image_file):
-        """Example text and image files should have matching timestamps."""
-        from tasktriage.files import _extract_timestamp
 
-        text_timestamp = _extract_timestamp(example_text_file.name)
-        image_timestamp = _extract_timestamp(example_image_file.name)
+class TestExampleFiles:
+    """Tests using example files from tests/examples directory."""
 
-        assert text_timestamp == image_timestamp
-        assert text_timestamp == "20251225_074353"
+    def test_example_files_share_timestamp(self, example_text_file, example_image_file):
+        """Example text and page-image files should parse to the same timestamp."""
+        assert parse_filename_datetime(example_text_file.name) == DT_20251225_074353
+        assert parse_filename_datetime(example_image_file.name) == DT_20251225_074353
+        assert _extract_timestamp(example_text_file.name) == "20251225_074353"
+        assert _extract_timestamp(example_image_file.name) == "20251225_074353"
 
 
 class TestParseFilenameDateTime:
-    """Tests for _parse_filename_datetime helper function."""
-
-    def test_parses_simple_filename(self):
-        """Should parse datetime from simple filename."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        result = parse_filename_datetime("20251225_073454.txt")
-        assert result == datetime(2025, 12, 25, 7, 34, 54)
-
-    def test_parses_png_filename(self):
-        """Should parse datetime from PNG filename."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        result = parse_filename_datetime("20251231_143000.png")
-        assert result == datetime(2025, 12, 31, 14, 30, 0)
-
-    def test_parses_page_identifier_filename(self):
-        """Should parse datetime from filename with page identifier."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        result = parse_filename_datetime("20251225_073454_Page_1.png")
-        assert result == datetime(2025, 12, 25, 7, 34, 54)
-
-    def test_parses_multi_digit_page(self):
-        """Should parse datetime from filename with multi-digit page number."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        result = parse_filename_datetime("20251225_073454_Page_15.png")
-        assert result == datetime(2025, 12, 25, 7, 34, 54)
-
-    def test_returns_none_for_invalid_filename(self):
-        """Should return None for invalid filename."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        result = parse_filename_datetime("not_a_timestamp.txt")
-        assert result is None
-
-    def test_falls_back_to_year_for_invalid_date(self):
-        """Should fall back to year parsing for invalid date values."""
-        from tasktriage.gdrive import parse_filename_datetime
-
-        # Month 25 is invalid, so it falls back to parsing just the year
-        result = parse_filename_datetime("20251325_073454.txt")
-        assert result == datetime(2025, 1, 1, 0, 0, 0)
+    """Tests for parse_filename_datetime helper function."""
+
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            pytest.param("20251225_073454.txt", DT_20251225_073454, id="simple"),
+            pytest.param("20251231_143000.png", DT_20251231_143000, id="png"),
+            pytest.param("20251225_073454_Page_1.png", DT_20251225_073454, id="page"),
+            pytest.param("20251225_073454_Page_15.png", DT_20251225_073454, id="multi-digit-page"),
+            pytest.param("not_a_timestamp.txt", None, id="invalid"),
+            # Month 13 is invalid, so it falls back to parsing just the year
+            pytest.param("20251325_073454.txt", datetime(2025, 1, 1, 0, 0, 0), id="year-fallback"),
+        ],
+    )
+    def test_parse_filename_datetime(self, filename, expected):
+        """Should parse the datetime from the filename timestamp."""
+        assert parse_filename_datetime(filename) == expected
 
 
 class TestLoadTaskNotesWithPageIdentifiers:
     """Tests for loading task notes with page identifier filenames."""
 
-    def test_loads_page_identifier_file(self, mock_usb_dir):
+    def test_loads_page_identifier_file(self, mock_usb_dir, usb_source, seed_raw_notes):
         """Should load PNG file with page identifier in filename."""
         page_file = mock_usb_dir / "20251228_100000_Page_1.png"
-        page_file.write_bytes(b"fake png data")
+        page_file.touch()
 
         # Create the raw_notes.txt file that Sync would create (uses base timestamp without page)
-        raw_notes_path = mock_usb_dir / "20251228_100000.raw_notes.txt"
-        raw_notes_path.write_text("Extracted text from page")
-
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
-
-            content, path, file_date = load_task_notes("daily", "png")
-
-            assert content == "Extracted text from page"
-            assert file_date == datetime(2025, 12, 28, 10, 0, 0)
-
-    def test_skips_page_file_with_existing_timestamp_analysis(self, mock_usb_dir):
-        """Should skip page file when analysis exists for that date."""
-        daily_dir = mock_usb_dir / "daily"
-
-        # Create page file at top level
-        page_file = mock_usb_dir / "20251228_100000_Page_1.png"
-        page_file.write_bytes(b"fake png data")
-
-        # Create raw_notes.txt for the page file
-        raw_notes_path = mock_usb_dir / "20251228_100000.raw_notes.txt"
-        raw_notes_path.write_text("Page content")
-
-        # Create analysis file using date format (in daily subdirectory)
-        analysis_file = daily_dir / "28_12_2025.triaged.txt"
-        analysis_file.write_text("Existing analysis")
-
-        # Create an older file without analysis at top level
-        older_file = mock_usb_dir / "20251227_090000.txt"
-        older_file.write_text("Older notes")
-
-        with patch("tasktriage.files.get_all_input_directories", return_value=[mock_usb_dir]), \
-             patch("tasktriage.files.get_active_source", return_value="usb"):
-            from tasktriage.files import load_task_notes
+        seed_raw_notes(mock_usb_dir, "20251228_100000", "Extracted text from page")
+
+        content, path, file_date = load_task_notes("daily", "png")
+
+        assert content == "Extracted text from page"
+        assert file_date == DT_20251228_100000
+
+    def test_skips_page_file_with_existing_analysis_usb(self, usb_source, seed_raw_notes, mkfile):
+        """Should skip a USB page file when an analysis exists for its date."""
+        # Page file from 28 Dec has an analysis (DD_MM_YYYY.triaged.txt); the older
+        # 27 Dec image does not, and both have raw notes from Sync
+        (usb_source / "20251228_100000_Page_1.png").touch()
+        seed_raw_notes(usb_source, "20251228_100000", "Analyzed notes")
+        (usb_source / "20251227_090000.png").touch()
+        seed_raw_notes(usb_source, "20251227_090000", "Older notes")
+        mkfile(usb_source / "daily" / "28_12_2025.triaged.txt", "Existing analysis")
+
+        content, path, file_date = load_task_notes("daily", "png")
+
+        assert content == "Older notes"
+        assert file_date == DT_20251227_090000
+
+    def test_skips_page_file_with_existing_analysis_gdrive(self, gdrive_source, mock_usb_dir, monkeypatch,
+                                                          seed_raw_notes, mkfile):
+        """Should skip a Drive page file when a local analysis exists for its date."""
+        monkeypatch.setattr("tasktriage.config.LOCAL_OUTPUT_DIR", str(mock_usb_dir))
+        raw_notes = seed_raw_notes(mock_usb_dir, "20251228_100000", "Analyzed notes")
+        seed_raw_notes(mock_usb_dir, "20251227_090000", "Older notes")
+        analysis = mkfile(mock_usb_dir / "daily" / "28_12_2025.triaged.txt", "Existing analysis")
+        # Raw notes predate the analysis, so no re-analysis is due
+        os.utime(raw_notes, (analysis.stat().st_mtime - 60,) * 2)
+        gdrive_source.list_notes_files.return_value = [
+            {"id": "file1", "name": "20251228_100000_Page_1.png", "mimeType": "image/png"},
+            {"id": "file2", "name": "20251227_090000.png", "mimeType": "image/png"},
+        ]
 
-            content, path, file_date = load_task_notes("daily", "txt")
+        content, path, file_date = load_task_notes("daily", "png")
 
-            # Should load the older file since the page file's date has analysis
-            assert "Older notes" in content
-            assert file_date == datetime(2025, 12, 27, 9, 0, 0)
+        assert content == "Older notes"
+        assert file_date == DT_20251227_090000
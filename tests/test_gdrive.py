@@ -2,19 +2,46 @@
 Tests for tasktriage.gdrive module.
 """
 
+import hashlib
 import io
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch, PropertyMock
+from unittest.mock import Mock, patch, PropertyMock
 
 import pytest
-
-
-@pytest.fixture
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from tasktriage.gdrive import (
+    _EXISTS_FIELDS,
+    _FOLDER_FIELDS,
+    _JSON_MODEL,
+    _LIST_FIELDS,
+    _LOOKUP_FIELDS,
+    _NUM_RETRIES,
+    ALL_MIME_TYPES,
+    IMAGE_MIME_TYPES,
+    PDF_MIME_TYPES,
+    TEXT_MIME_TYPES,
+    VISUAL_MIME_TYPES,
+    GoogleDriveClient,
+    _listings,
+    _subfolder_ids,
+    extract_timestamp_from_filename,
+    get_file_extension,
+    is_gdrive_configured,
+    parse_filename,
+    parse_filename_datetime,
+)
+
+
+@pytest.fixture(scope="session")
 def mock_oauth_credentials():
-    """Create mock OAuth credentials for testing."""
-    from google.oauth2.credentials import Credentials
+    """Create mock OAuth credentials shared by every test.
 
+    Tests that change attributes must do so through monkeypatch so the
+    change is undone afterwards.
+    """
     creds = Mock(spec=Credentials)
     creds.token = "mock_access_token"
     creds.refresh_token = "mock_refresh_token"
@@ -27,13 +54,21 @@ def mock_oauth_credentials():
     return creds
 
 
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    """Reset the process-wide client caches."""
+    _subfolder_ids.clear()
+    _listings.clear()
+    yield
+    _subfolder_ids.clear()
+    _listings.clear()
+
+
 class TestGoogleDriveClientInit:
     """Tests for GoogleDriveClient initialization."""
 
     def test_init_with_oauth_credentials(self, mock_oauth_credentials):
         """Should initialize with OAuth credentials."""
-        from tasktriage.gdrive import GoogleDriveClient
-
         client = GoogleDriveClient(
             credentials=mock_oauth_credentials,
             folder_id="test-folder-id"
@@ -43,8 +78,6 @@ class TestGoogleDriveClientInit:
 
     def test_raises_when_credentials_not_provided(self):
         """Should raise ValueError when credentials are not provided."""
-        from tasktriage.gdrive import GoogleDriveClient
-
         with pytest.raises(ValueError, match="OAuth credentials required"):
             GoogleDriveClient(credentials=None, folder_id="test-folder-id")
 
@@ -52,8 +85,6 @@ class TestGoogleDriveClientInit:
         """Should use GOOGLE_DRIVE_FOLDER_ID from environment when not provided."""
         monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "env-folder-id")
 
-        from tasktriage.gdrive import GoogleDriveClient
-
         client = GoogleDriveClient(credentials=mock_oauth_credentials)
         assert client.folder_id == "env-folder-id"
 
@@ -61,8 +92,6 @@ class TestGoogleDriveClientInit:
         """Explicit folder_id parameter should override environment variable."""
         monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "env-folder-id")
 
-        from tasktriage.gdrive import GoogleDriveClient
-
         client = GoogleDriveClient(
             credentials=mock_oauth_credentials,
             folder_id="explicit-folder-id"
@@ -76,29 +105,27 @@ class TestGoogleDriveClientService:
     def test_service_lazily_initialized(self, mock_oauth_credentials):
         """Service should be lazily initialized on first access."""
         with patch("tasktriage.gdrive.build") as mock_build:
-            mock_service = MagicMock()
+            mock_service = Mock()
             mock_build.return_value = mock_service
 
-            from tasktriage.gdrive import GoogleDriveClient
-
-            client = GoogleDriveClient(credentials=mock_oauth_credentials)
-            assert client._service is None
+            client = GoogleDriveClient(credentials=mock_oauth_credentials, folder_id="root-folder-id")
+            assert "service" not in client.__dict__
 
             # Access service property
             _ = client.service
 
-            mock_build.assert_called_once_with("drive", "v3", credentials=mock_oauth_credentials)
-            assert client._service == mock_service
+            mock_build.assert_called_once_with(
+                "drive", "v3", credentials=mock_oauth_credentials, model=_JSON_MODEL
+            )
+            assert client.__dict__["service"] is mock_service
 
     def test_service_cached_after_first_access(self, mock_oauth_credentials):
         """Service should be cached after first initialization."""
         with patch("tasktriage.gdrive.build") as mock_build:
-            mock_service = MagicMock()
+            mock_service = Mock()
             mock_build.return_value = mock_service
 
-            from tasktriage.gdrive import GoogleDriveClient
-
-            client = GoogleDriveClient(credentials=mock_oauth_credentials)
+            client = GoogleDriveClient(credentials=mock_oauth_credentials, folder_id="root-folder-id")
 
             # Access service multiple times
             service1 = client.service
@@ -107,21 +134,20 @@ class TestGoogleDriveClientService:
             assert service1 is service2
             assert mock_build.call_count == 1
 
-    def test_service_refreshes_expired_credentials(self, mock_oauth_credentials):
+    def test_service_refreshes_expired_credentials(self, mock_oauth_credentials, monkeypatch):
         """Service property should refresh expired credentials before building."""
-        mock_oauth_credentials.expired = True
-        mock_oauth_credentials.refresh_token = "refresh_token"
+        monkeypatch.setattr(mock_oauth_credentials, "expired", True)
+        monkeypatch.setattr(mock_oauth_credentials, "refresh_token", "refresh_token")
+        monkeypatch.setattr(mock_oauth_credentials, "refresh", Mock())
 
         with patch("tasktriage.gdrive.build") as mock_build, \
              patch("tasktriage.gdrive.Request") as mock_request_class:
-            mock_service = MagicMock()
+            mock_service = Mock()
             mock_build.return_value = mock_service
-            mock_request = MagicMock()
+            mock_request = Mock()
             mock_request_class.return_value = mock_request
 
-            from tasktriage.gdrive import GoogleDriveClient
-
-            client = GoogleDriveClient(credentials=mock_oauth_credentials)
+            client = GoogleDriveClient(credentials=mock_oauth_credentials, folder_id="root-folder-id")
 
             # Access service
             _ = client.service
@@ -130,6 +156,25 @@ class TestGoogleDriveClientService:
             mock_oauth_credentials.refresh.assert_called_once_with(mock_request)
             mock_build.assert_called_once()
 
+    def test_service_refreshes_when_near_expiry(self):
+        """Credentials within google-auth's refresh threshold count as expired."""
+        near_expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=30)
+        credentials = Credentials(
+            token="access-token",
+            refresh_token="refresh-token",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="client-id",
+            client_secret="client-secret",
+            expiry=near_expiry,
+        )
+
+        with patch("tasktriage.gdrive.build"), \
+             patch.object(Credentials, "refresh") as mock_refresh:
+            client = GoogleDriveClient(credentials=credentials, folder_id="root-folder-id")
+            _ = client.service
+
+            mock_refresh.assert_called_once()
+
 
 class TestGoogleDriveClientOperations:
     """Tests for GoogleDriveClient file operations."""
@@ -138,11 +183,11 @@ class TestGoogleDriveClientOperations:
     def mock_client(self, mock_oauth_credentials):
         """Create a mock GoogleDriveClient with mocked service."""
         with patch("tasktriage.gdrive.build") as mock_build:
-            mock_service = MagicMock()
+            # Drive API methods are attached to Resource at runtime, so there is
+            # no class to spec against; a plain Mock skips the magic methods
+            mock_service = Mock()
             mock_build.return_value = mock_service
 
-            from tasktriage.gdrive import GoogleDriveClient
-
             client = GoogleDriveClient(
                 credentials=mock_oauth_credentials,
                 folder_id="root-folder-id"
@@ -194,6 +239,22 @@ class TestGoogleDriveClientOperations:
         # Should only call API once
         assert mock_list.execute.call_count == 1
 
+    def test_get_subfolder_id_cache_shared_across_clients(self, mock_client, mock_oauth_credentials):
+        """New clients for the same root folder should reuse cached subfolder IDs."""
+        client, mock_service = mock_client
+
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {
+            "files": [{"id": "daily-folder-id", "name": "daily"}]
+        }
+        client.get_subfolder_id("daily")
+
+        other = GoogleDriveClient(credentials=mock_oauth_credentials, folder_id="root-folder-id")
+
+        assert other.get_subfolder_id("daily") == "daily-folder-id"
+        assert mock_list.execute.call_count == 1
+
     def test_list_notes_files_returns_files(self, mock_client):
         """Should return list of files in subfolder."""
         client, mock_service = mock_client
@@ -216,6 +277,142 @@ class TestGoogleDriveClientOperations:
         assert len(result) == 2
         assert result[0]["name"] == "20251231_143000.txt"
 
+    def test_iter_notes_files_follows_page_tokens(self, mock_client):
+        """Should yield files from every page, requesting the next page lazily."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "daily-folder-id"
+
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.side_effect = [
+            {"files": [{"id": "file1", "name": "20251231_143000.txt"}], "nextPageToken": "page-2"},
+            {"files": [{"id": "file2", "name": "20251230_090000.png"}]},
+        ]
+
+        files = client.iter_notes_files("daily")
+
+        assert next(files)["id"] == "file1"
+        assert mock_list.execute.call_count == 1
+        assert [f["id"] for f in files] == ["file2"]
+        assert mock_files.list.call_args.kwargs["pageToken"] == "page-2"
+
+    def test_list_notes_files_requests_minimal_fields(self, mock_client):
+        """Should request only the file fields callers use."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "daily-folder-id"
+
+        mock_files = mock_service.files.return_value
+        mock_files.list.return_value.execute.return_value = {"files": []}
+
+        client.list_notes_files("daily")
+
+        fields = mock_files.list.call_args.kwargs["fields"]
+        assert fields == _LIST_FIELDS == "nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum)"
+
+    def test_get_subfolder_id_requests_minimal_fields(self, mock_client):
+        """Should request only the folder ID and name when resolving a subfolder."""
+        client, mock_service = mock_client
+
+        mock_files = mock_service.files.return_value
+        mock_files.list.return_value.execute.return_value = {
+            "files": [{"id": "daily-folder-id", "name": "daily"}]
+        }
+
+        client.get_subfolder_id("daily")
+
+        assert mock_files.list.call_args.kwargs["fields"] == _FOLDER_FIELDS == "files(id, name)"
+
+    def test_expired_subfolder_ids_are_resolved_again(self, mock_client, monkeypatch):
+        """Cached subfolder IDs older than the TTL should be looked up afresh."""
+        client, mock_service = mock_client
+
+        mock_list = mock_service.files.return_value.list.return_value
+        mock_list.execute.return_value = {"files": [{"id": "daily-folder-id", "name": "daily"}]}
+        client.get_subfolder_id("daily")
+        client.get_subfolder_id("daily")
+        assert mock_list.execute.call_count == 1
+
+        monkeypatch.setattr("tasktriage.gdrive._FOLDER_ID_TTL", -1)
+        mock_list.execute.return_value = {"files": [{"id": "new-daily-folder-id", "name": "daily"}]}
+
+        assert client.get_subfolder_id("daily") == "new-daily-folder-id"
+        assert mock_list.execute.call_count == 2
+
+    def test_listing_stale_subfolder_resolves_it_again(self, mock_client):
+        """A 404 for a cached subfolder ID should re-resolve the folder and retry the listing."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "deleted-folder-id"
+        mock_list = mock_service.files.return_value.list.return_value
+        mock_list.execute.side_effect = [
+            HttpError(Mock(status=404), b"File not found"),
+            {"files": [{"id": "new-daily-folder-id", "name": "daily"}]},
+            {"files": [{"id": "file1", "name": "20251231_143000.txt"}]},
+        ]
+
+        files = client.list_notes_files("daily")
+
+        assert [f["id"] for f in files] == ["file1"]
+        assert client._folder_cache["daily"] == "new-daily-folder-id"
+        assert "'new-daily-folder-id' in parents" in mock_service.files.return_value.list.call_args.kwargs["q"]
+
+    def test_upload_404_forgets_subfolder_id(self, mock_client):
+        """A 404 on upload should drop the cached subfolder ID and re-raise."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "deleted-folder-id"
+        mock_files = mock_service.files.return_value
+        mock_files.create.return_value.execute.side_effect = HttpError(Mock(status=404), b"File not found")
+
+        with pytest.raises(HttpError):
+            client.upload_file("daily", "29_12_2025.triaged.txt", "content")
+
+        assert "daily" not in client._folder_cache
+
+    def test_get_subfolder_ids_resolves_names_in_one_request(self, mock_client):
+        """Should resolve several subfolders with one files.list request."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "daily-folder-id"
+
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {
+            "files": [
+                {"id": "weekly-folder-id", "name": "weekly"},
+                {"id": "monthly-folder-id", "name": "monthly"},
+            ]
+        }
+
+        result = client.get_subfolder_ids(["daily", "weekly", "monthly", "annual"])
+
+        assert result == {
+            "daily": "daily-folder-id",
+            "weekly": "weekly-folder-id",
+            "monthly": "monthly-folder-id",
+        }
+        assert mock_list.execute.call_count == 1
+        query = mock_files.list.call_args.kwargs["q"]
+        assert "name = 'weekly' or name = 'monthly' or name = 'annual'" in query
+        assert client.get_subfolder_id("weekly") == "weekly-folder-id"
+        assert mock_list.execute.call_count == 1
+
+    def test_list_notes_files_retries_transient_errors(self, mock_client):
+        """Should ask the client library to retry 429/5xx responses."""
+        client, mock_service = mock_client
+
+        client._folder_cache["daily"] = "daily-folder-id"
+
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {"files": []}
+
+        client.list_notes_files("daily")
+
+        mock_list.execute.assert_called_once_with(num_retries=_NUM_RETRIES)
+
     def test_list_notes_files_raises_when_folder_not_found(self, mock_client):
         """Should raise FileNotFoundError when subfolder doesn't exist."""
         client, mock_service = mock_client
@@ -228,41 +425,47 @@ class TestGoogleDriveClientOperations:
             client.list_notes_files("nonexistent")
 
     def test_download_file_returns_bytes(self, mock_client):
-        """Should download and return file content as bytes."""
+        """Should fetch the file content with a single media request."""
         client, mock_service = mock_client
 
         mock_files = mock_service.files.return_value
-        mock_request = MagicMock()
-        mock_files.get_media.return_value = mock_request
+        mock_request = mock_files.get_media.return_value
+        mock_request.execute.return_value = b"file content"
 
-        # Mock MediaIoBaseDownload
-        with patch("tasktriage.gdrive.MediaIoBaseDownload") as mock_downloader_class:
-            mock_downloader = MagicMock()
-            mock_downloader.next_chunk.side_effect = [(None, False), (None, True)]
-            mock_downloader_class.return_value = mock_downloader
+        result = client.download_file("file-id")
 
-            # We need to simulate writing to the buffer
-            def setup_buffer(buffer, request):
-                buffer.write(b"file content")
-                return mock_downloader
+        mock_files.get_media.assert_called_with(fileId="file-id")
+        mock_request.execute.assert_called_once_with(num_retries=_NUM_RETRIES)
+        assert result == b"file content"
+
+    def test_download_many_returns_content_by_id(self, mock_client):
+        """Should download every file and map each ID to its content."""
+        client, mock_service = mock_client
 
-            mock_downloader_class.side_effect = setup_buffer
+        def fetch_content(file_id, service=None):
+            return f"content of {file_id}".encode()
 
-            result = client.download_file("file-id")
+        client._fetch_media = Mock(side_effect=fetch_content)
 
-            mock_files.get_media.assert_called_with(fileId="file-id")
+        with patch("tasktriage.gdrive.build"):
+            result = client.download_many(["file1", "file2", "file3"])
+
+        assert result == {
+            "file1": b"content of file1",
+            "file2": b"content of file2",
+            "file3": b"content of file3",
+        }
 
     def test_download_file_text_returns_string(self, mock_client):
         """Should download and return text file content as string."""
         client, mock_service = mock_client
 
-        # Mock download_file to return bytes
-        client.download_file = MagicMock(return_value=b"Hello, World!")
+        client._fetch_media = Mock(return_value=b"Hello, World!")
 
         result = client.download_file_text("file-id")
 
         assert result == "Hello, World!"
-        client.download_file.assert_called_with("file-id")
+        client._fetch_media.assert_called_once_with("file-id")
 
     def test_file_exists_returns_true_when_found(self, mock_client):
         """Should return True when file exists."""
@@ -279,6 +482,7 @@ class TestGoogleDriveClientOperations:
         result = client.file_exists("daily", "20251231_143000.txt")
 
         assert result is True
+        assert mock_files.list.call_args.kwargs["fields"] == _LOOKUP_FIELDS
 
     def test_file_exists_returns_false_when_not_found(self, mock_client):
         """Should return False when file doesn't exist."""
@@ -294,165 +498,280 @@ class TestGoogleDriveClientOperations:
 
         assert result is False
 
+    def test_file_exists_uses_listing_cache(self, mock_client):
+        """Should answer for listed files from a fresh listing without more requests."""
+        client, mock_service = mock_client
 
-class TestIsGdriveConfigured:
-    """Tests for is_gdrive_configured function."""
-
-    def test_returns_true_when_oauth_configured(self, monkeypatch):
-        """Should return True when OAuth credentials and folder ID are set."""
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
-
-        from tasktriage.gdrive import is_gdrive_configured
-
-        assert is_gdrive_configured() is True
+        client._folder_cache["daily"] = "daily-folder-id"
 
-    def test_returns_false_when_client_id_not_set(self, monkeypatch):
-        """Should return False when OAuth client ID is not set."""
-        monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_ID", raising=False)
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {"files": [{"id": "file1", "name": "29_12_2025.triaged.txt"}]}
 
-        from tasktriage.gdrive import is_gdrive_configured
+        client.list_notes_files("daily")
+        results = [client.file_exists("daily", "29_12_2025.triaged.txt") for _ in range(3)]
 
-        assert is_gdrive_configured() is False
+        assert results == [True, True, True]
+        assert mock_list.execute.call_count == 1
 
-    def test_returns_false_when_client_secret_not_set(self, monkeypatch):
-        """Should return False when OAuth client secret is not set."""
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
-        monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_SECRET", raising=False)
-        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
+    def test_file_exists_queries_names_missing_from_listing(self, mock_client):
+        """A file uploaded elsewhere after the listing should still be found."""
+        client, mock_service = mock_client
 
-        from tasktriage.gdrive import is_gdrive_configured
+        client._folder_cache["daily"] = "daily-folder-id"
 
-        assert is_gdrive_configured() is False
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {"files": []}
+        client.list_notes_files("daily")
 
-    def test_returns_false_when_folder_id_not_set(self, monkeypatch):
-        """Should return False when folder ID is not set."""
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.delenv("GOOGLE_DRIVE_FOLDER_ID", raising=False)
+        mock_list.execute.return_value = {"files": [{"id": "file2", "name": "30_12_2025.triaged.txt"}]}
 
-        from tasktriage.gdrive import is_gdrive_configured
+        assert client.file_exists("daily", "30_12_2025.triaged.txt") is True
+        assert mock_list.execute.call_count == 2
 
-        assert is_gdrive_configured() is False
+    def test_batch_file_exists_uses_listing_cache(self, mock_client):
+        """Should only query Drive for pairs not named in a fresh listing."""
+        client, mock_service = mock_client
 
+        client._folder_cache.update({"daily": "daily-folder-id", "weekly": "weekly-folder-id"})
 
-class TestParseFilenameDatetime:
-    """Tests for parse_filename_datetime function."""
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {"files": [{"id": "file1", "name": "29_12_2025.triaged.txt"}]}
+        client.list_notes_files("daily")
 
-    def test_parses_txt_filename(self):
-        """Should parse datetime from .txt filename."""
-        from tasktriage.gdrive import parse_filename_datetime
+        # Uploaded by another process after the listing
+        mock_list.execute.return_value = {
+            "files": [{"name": "30_12_2025.triaged.txt", "parents": ["daily-folder-id"]}]
+        }
+        result = client.batch_file_exists([
+            ("daily", "29_12_2025.triaged.txt"),
+            ("daily", "30_12_2025.triaged.txt"),
+            ("weekly", "29_12_2025.triaged.txt"),
+        ])
+
+        assert result == {
+            ("daily", "29_12_2025.triaged.txt"): True,
+            ("daily", "30_12_2025.triaged.txt"): True,
+            ("weekly", "29_12_2025.triaged.txt"): False,
+        }
+        assert mock_list.execute.call_count == 2
+        query = mock_files.list.call_args.kwargs["q"]
+        # The listed daily file is not queried again; only the weekly one is
+        assert query.count("29_12_2025.triaged.txt") == 1
+        assert "30_12_2025.triaged.txt" in query
+
+    def test_upload_file_updates_listing_cache(self, mock_client):
+        """Uploaded files should be visible to cached existence checks."""
+        client, mock_service = mock_client
 
-        result = parse_filename_datetime("20251231_143000.txt")
+        client._folder_cache["daily"] = "daily-folder-id"
 
-        assert result == datetime(2025, 12, 31, 14, 30, 0)
+        mock_files = mock_service.files.return_value
+        mock_files.list.return_value.execute.return_value = {"files": []}
+        mock_files.create.return_value.execute.return_value = {"id": "new-file-id"}
 
-    def test_parses_png_filename(self):
-        """Should parse datetime from .png filename."""
-        from tasktriage.gdrive import parse_filename_datetime
+        client.list_notes_files("daily")
+        client.upload_file("daily", "29_12_2025.triaged.txt", "Plan")
 
-        result = parse_filename_datetime("20251230_090000.png")
+        assert client.file_exists("daily", "29_12_2025.triaged.txt") is True
+        assert mock_files.list.return_value.execute.call_count == 1
 
-        assert result == datetime(2025, 12, 30, 9, 0, 0)
+    def test_file_exists_many_uses_one_list_request(self, mock_client):
+        """Should check all filenames with a single files.list request."""
+        client, mock_service = mock_client
 
-    def test_parses_triaged_filename_year_only(self):
-        """Triaged filenames (DD_MM_YYYY) extract only the year component."""
-        from tasktriage.gdrive import parse_filename_datetime
+        client._folder_cache["daily"] = "daily-folder-id"
 
-        # The function extracts YYYY pattern from the filename
-        # DD_MM_YYYY format doesn't match YYYYMMDD pattern, so it falls back to YYYY
-        result = parse_filename_datetime("29_12_2025.triaged.txt")
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {
+            "files": [{"name": "20251231_143000.txt", "parents": ["daily-folder-id"]}]
+        }
 
-        # Only the year is extractable from this format
-        assert result == datetime(2025, 1, 1, 0, 0, 0)
+        result = client.file_exists_many("daily", ["20251231_143000.txt", "20251230_090000.txt"])
 
-    def test_parses_page_identifier_filename(self):
-        """Should parse datetime from filename with page identifier."""
-        from tasktriage.gdrive import parse_filename_datetime
+        assert mock_list.execute.call_count == 1
+        query = mock_files.list.call_args.kwargs["q"]
+        assert "name = '20251231_143000.txt' or name = '20251230_090000.txt'" in query
+        assert mock_files.list.call_args.kwargs["fields"] == _EXISTS_FIELDS
+        assert result == {"20251231_143000.txt": True, "20251230_090000.txt": False}
 
-        result = parse_filename_datetime("20251225_073454_Page_1.png")
+    def test_batch_file_exists_spans_subfolders_in_one_request(self, mock_client):
+        """Should check pairs from several subfolders with one files.list request."""
+        client, mock_service = mock_client
 
-        assert result == datetime(2025, 12, 25, 7, 34, 54)
+        client._folder_cache.update({
+            "daily": "daily-folder-id",
+            "weekly": "weekly-folder-id",
+            "monthly": "monthly-folder-id",
+        })
 
-    def test_parses_multi_digit_page_identifier(self):
-        """Should parse datetime from filename with multi-digit page number."""
-        from tasktriage.gdrive import parse_filename_datetime
+        mock_files = mock_service.files.return_value
+        mock_list = mock_files.list.return_value
+        mock_list.execute.return_value = {
+            "files": [
+                {"name": "29_12_2025.triaged.txt", "parents": ["daily-folder-id"]},
+                {"name": "29_12_2025.triaged.txt", "parents": ["weekly-folder-id"]},
+            ]
+        }
+        pairs = [("daily", f"{day}_12_2025.triaged.txt") for day in range(22, 30)]
+        pairs += [("weekly", "29_12_2025.triaged.txt"), ("monthly", "12_2025.triaged.txt")]
 
-        result = parse_filename_datetime("20251225_073454_Page_15.png")
+        result = client.batch_file_exists(pairs)
 
-        assert result == datetime(2025, 12, 25, 7, 34, 54)
+        assert mock_list.execute.call_count == 1
+        assert [pair for pair, found in result.items() if found] == [
+            ("daily", "29_12_2025.triaged.txt"),
+            ("weekly", "29_12_2025.triaged.txt"),
+        ]
+        assert len(result) == 10
 
-    def test_returns_none_for_invalid_format(self):
-        """Should return None for invalid filename format."""
-        from tasktriage.gdrive import parse_filename_datetime
+    def test_read_local_copy_compares_md5_checksum(self, temp_dir):
+        """Should return the local bytes only when they match the listed checksum."""
+        local_path = temp_dir / "29_12_2025.triaged.txt"
+        file_info = {"id": "file-1", "md5Checksum": hashlib.md5(b"Monday plan").hexdigest()}
 
-        result = parse_filename_datetime("invalid_filename.txt")
+        assert GoogleDriveClient.read_local_copy(local_path, file_info) is None
 
-        assert result is None
+        local_path.write_bytes(b"Monday plan")
+        assert GoogleDriveClient.read_local_copy(local_path, file_info) == b"Monday plan"
+        assert GoogleDriveClient.read_local_copy(local_path, {"id": "file-1"}) is None
 
-    def test_parses_YYYYMMDD_timestamp(self):
-        """Should parse YYYYMMDD format (for weekly/monthly analysis files)."""
-        from tasktriage.gdrive import parse_filename_datetime
+        local_path.write_bytes(b"Edited plan")
+        assert GoogleDriveClient.read_local_copy(local_path, file_info) is None
 
-        result = parse_filename_datetime("20251231.txt")
 
-        assert result == datetime(2025, 12, 31, 0, 0)
+class TestIsGdriveConfigured:
+    """Tests for is_gdrive_configured function."""
 
+    def test_returns_true_when_oauth_configured(self, monkeypatch):
+        """Should return True when OAuth credentials and folder ID are set."""
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
 
-class TestExtractTimestampFromFilename:
-    """Tests for extract_timestamp_from_filename function."""
+        assert is_gdrive_configured() is True
 
-    def test_extracts_from_simple_filename(self):
-        """Should extract timestamp from simple filename."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+    def test_returns_false_when_client_id_not_set(self, monkeypatch):
+        """Should return False when OAuth client ID is not set."""
+        monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_ID", raising=False)
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
 
-        result = extract_timestamp_from_filename("20251231_143000.txt")
-        assert result == "20251231_143000"
+        assert is_gdrive_configured() is False
 
-    def test_extracts_from_png_filename(self):
-        """Should extract timestamp from PNG filename."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+    def test_returns_false_when_client_secret_not_set(self, monkeypatch):
+        """Should return False when OAuth client secret is not set."""
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
+        monkeypatch.delenv("GOOGLE_OAUTH_CLIENT_SECRET", raising=False)
+        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
 
-        result = extract_timestamp_from_filename("20251225_073454.png")
-        assert result == "20251225_073454"
+        assert is_gdrive_configured() is False
 
-    def test_extracts_from_page_identifier_filename(self):
-        """Should extract timestamp from filename with page identifier."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+    def test_returns_false_when_folder_id_not_set(self, monkeypatch):
+        """Should return False when folder ID is not set."""
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.delenv("GOOGLE_DRIVE_FOLDER_ID", raising=False)
 
-        result = extract_timestamp_from_filename("20251225_073454_Page_1.png")
-        assert result == "20251225_073454"
+        assert is_gdrive_configured() is False
 
-    def test_extracts_from_multi_digit_page(self):
-        """Should extract timestamp from filename with multi-digit page number."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+    def test_reflects_env_changes_between_calls(self, monkeypatch):
+        """Should not memoize; the config UI can change settings mid-process."""
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_ID", "test-client-id")
+        monkeypatch.setenv("GOOGLE_OAUTH_CLIENT_SECRET", "test-client-secret")
+        monkeypatch.delenv("GOOGLE_DRIVE_FOLDER_ID", raising=False)
+        assert is_gdrive_configured() is False
 
-        result = extract_timestamp_from_filename("20251225_073454_Page_12.png")
-        assert result == "20251225_073454"
+        monkeypatch.setenv("GOOGLE_DRIVE_FOLDER_ID", "test-folder-id")
+        assert is_gdrive_configured() is True
 
-    def test_extracts_from_analysis_filename(self):
-        """Should extract timestamp from analysis filename."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
 
-        result = extract_timestamp_from_filename("20251225_073454.triaged.txt")
-        assert result == "20251225_073454"
+class TestParseFilenameDatetime:
+    """Tests for parse_filename_datetime function."""
 
-    def test_returns_none_for_invalid_filename(self):
-        """Should return None for invalid filename."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            pytest.param("20251231_143000.txt", datetime(2025, 12, 31, 14, 30, 0), id="txt"),
+            pytest.param("20251230_090000.png", datetime(2025, 12, 30, 9, 0, 0), id="png"),
+            pytest.param("20251225_073454_Page_1.png", datetime(2025, 12, 25, 7, 34, 54), id="page"),
+            pytest.param("20251225_073454_Page_15.png", datetime(2025, 12, 25, 7, 34, 54), id="multi-digit-page"),
+            # Weekly/monthly analysis files use a bare YYYYMMDD timestamp
+            pytest.param("20251231.txt", datetime(2025, 12, 31, 0, 0), id="date-only"),
+            # DD_MM_YYYY does not match YYYYMMDD, so only the year is extracted
+            pytest.param("29_12_2025.triaged.txt", datetime(2025, 1, 1, 0, 0, 0), id="triaged-year-only"),
+            pytest.param("invalid_filename.txt", None, id="invalid"),
+        ],
+    )
+    def test_parse_filename_datetime(self, filename, expected):
+        """Should parse the datetime from the filename, or None when there is none."""
+        assert parse_filename_datetime(filename) == expected
+
+    def test_parse_filename_datetime_is_cached(self):
+        """Repeated calls with the same filename should be served from the cache."""
+        parse_filename_datetime.cache_clear()
+        first = parse_filename_datetime("20251225_073454.txt")
+        second = parse_filename_datetime("20251225_073454.txt")
+
+        assert first == second
+        info = parse_filename_datetime.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestParseFilename:
+    """Tests for parse_filename function."""
+
+    @pytest.mark.parametrize(
+        "filename",
+        [
+            pytest.param("20251231_143000.txt", id="txt"),
+            pytest.param("20251225_073454_Page_12.png", id="page"),
+            # Month 13 is invalid, so the datetime falls back to the year
+            pytest.param("20251325_073454.txt", id="invalid-date"),
+            pytest.param("29_12_2025.triaged.txt", id="triaged"),
+            pytest.param("invalid_filename.txt", id="invalid"),
+        ],
+    )
+    def test_matches_separate_parsers(self, filename):
+        """Should agree with extract_timestamp_from_filename and parse_filename_datetime."""
+        assert parse_filename(filename) == (
+            extract_timestamp_from_filename(filename),
+            parse_filename_datetime(filename),
+        )
 
-        result = extract_timestamp_from_filename("invalid_filename.txt")
-        assert result is None
 
-    def test_returns_none_for_short_filename(self):
-        """Should return None for filename without proper timestamp."""
-        from tasktriage.gdrive import extract_timestamp_from_filename
+class TestExtractTimestampFromFilename:
+    """Tests for extract_timestamp_from_filename function."""
 
-        result = extract_timestamp_from_filename("20251225.txt")
-        assert result is None
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            pytest.param("20251231_143000.txt", "20251231_143000", id="simple"),
+            pytest.param("20251225_073454.png", "20251225_073454", id="png"),
+            pytest.param("20251225_073454_Page_1.png", "20251225_073454", id="page"),
+            pytest.param("20251225_073454_Page_12.png", "20251225_073454", id="multi-digit-page"),
+            pytest.param("20251225_073454.triaged.txt", "20251225_073454", id="analysis"),
+            pytest.param("invalid_filename.txt", None, id="invalid"),
+            pytest.param("20251225.txt", None, id="date-only"),
+        ],
+    )
+    def test_extract_timestamp_from_filename(self, filename, expected):
+        """Should extract the leading timestamp, or None when there is none."""
+        assert extract_timestamp_from_filename(filename) == expected
+
+    def test_extract_timestamp_from_filename_is_cached(self):
+        """Repeated calls with the same filename should be served from the cache."""
+        extract_timestamp_from_filename.cache_clear()
+        extract_timestamp_from_filename("20251225_073454_Page_1.png")
+        extract_timestamp_from_filename("20251225_073454_Page_1.png")
+
+        info = extract_timestamp_from_filename.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
 
 
 class TestGetFileExtension:
@@ -460,22 +779,21 @@ class TestGetFileExtension:
 
     def test_returns_txt_for_text_plain(self):
         """Should return .txt for text/plain MIME type."""
-        from tasktriage.gdrive import get_file_extension
-
         result = get_file_extension("text/plain")
         assert result == ".txt"
 
     def test_returns_png_for_image_png(self):
         """Should return .png for image/png MIME type."""
-        from tasktriage.gdrive import get_file_extension
-
         result = get_file_extension("image/png")
         assert result == ".png"
 
+    def test_returns_pdf_for_application_pdf(self):
+        """Should return .pdf for application/pdf MIME type."""
+        result = get_file_extension("application/pdf")
+        assert result == ".pdf"
+
     def test_returns_txt_for_unknown_mime_type(self):
         """Should return .txt as default for unknown MIME types."""
-        from tasktriage.gdrive import get_file_extension
-
         result = get_file_extension("application/octet-stream")
         assert result == ".txt"
 
@@ -485,19 +803,34 @@ class TestMimeTypeConstants:
 
     def test_text_mime_types_contains_text_plain(self):
         """TEXT_MIME_TYPES should include text/plain."""
-        from tasktriage.gdrive import TEXT_MIME_TYPES
-
         assert "text/plain" in TEXT_MIME_TYPES
 
     def test_image_mime_types_contains_png(self):
         """IMAGE_MIME_TYPES should include image/png."""
-        from tasktriage.gdrive import IMAGE_MIME_TYPES
-
         assert "image/png" in IMAGE_MIME_TYPES
 
     def test_all_mime_types_is_union(self):
         """ALL_MIME_TYPES should be union of text and visual types (images + PDFs)."""
-        from tasktriage.gdrive import TEXT_MIME_TYPES, VISUAL_MIME_TYPES, ALL_MIME_TYPES
-
         expected = TEXT_MIME_TYPES | VISUAL_MIME_TYPES
         assert ALL_MIME_TYPES == expected
+
+    def test_mime_type_constants_are_immutable(self):
+        """MIME type constants should be frozensets so they can't be mutated at runtime."""
+        for constant in (TEXT_MIME_TYPES, IMAGE_MIME_TYPES, PDF_MIME_TYPES, VISUAL_MIME_TYPES, ALL_MIME_TYPES):
+            assert isinstance(constant, frozenset)
+
+
+class TestDriveJsonModel:
+    """Tests for the JSON model used to decode Drive API responses."""
+
+    def test_parses_response_bytes(self):
+        """Should decode a JSON response body straight from bytes."""
+        content = b'{"files": [{"id": "file1", "name": "20251231_143000.txt"}]}'
+
+        assert _JSON_MODEL.deserialize(content) == {
+            "files": [{"id": "file1", "name": "20251231_143000.txt"}]
+        }
+
+    def test_returns_non_json_content_unchanged(self):
+        """Should fall back to the library behaviour for non-JSON bodies."""
+        assert _JSON_MODEL.deserialize(b"") == ""
@@ -3,10 +3,21 @@ Tests for tasktriage.image module.
 """
 
 import base64
+import io
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
+
+from tasktriage.image import (
+    DEFAULT_MODEL,
+    IMAGE_EXTENSIONS,
+    MEDIA_TYPE_MAP,
+    extract_text_from_image,
+)
+from tasktriage.prompts import IMAGE_EXTRACTION_PROMPT
 
 
 class TestImageExtensions:
@@ -14,29 +25,21 @@ class TestImageExtensions:
 
     def test_image_extensions_contains_png(self):
         """Should include .png extension."""
-        from tasktriage.image import IMAGE_EXTENSIONS
-
         assert ".png" in IMAGE_EXTENSIONS
 
     def test_image_extensions_contains_jpeg_formats(self):
         """Should include JPEG extensions (.jpg and .jpeg)."""
-        from tasktriage.image import IMAGE_EXTENSIONS
-
         assert ".jpg" in IMAGE_EXTENSIONS
         assert ".jpeg" in IMAGE_EXTENSIONS
 
     def test_image_extensions_contains_gif_and_webp(self):
         """Should include GIF and WebP extensions."""
-        from tasktriage.image import IMAGE_EXTENSIONS
-
         assert ".gif" in IMAGE_EXTENSIONS
         assert ".webp" in IMAGE_EXTENSIONS
 
-    def test_image_extensions_is_set(self):
-        """IMAGE_EXTENSIONS should be a set for efficient lookups."""
-        from tasktriage.image import IMAGE_EXTENSIONS
-
-        assert isinstance(IMAGE_EXTENSIONS, set)
+    def test_image_extensions_is_frozenset(self):
+        """IMAGE_EXTENSIONS should be an immutable set for efficient lookups."""
+        assert isinstance(IMAGE_EXTENSIONS, frozenset)
 
 
 class TestMediaTypeMap:
@@ -44,15 +47,11 @@ class TestMediaTypeMap:
 
     def test_media_type_map_contains_png(self):
         """Should map .png to image/png."""
-        from tasktriage.image import MEDIA_TYPE_MAP
-
         assert ".png" in MEDIA_TYPE_MAP
         assert MEDIA_TYPE_MAP[".png"] == "image/png"
 
     def test_media_type_map_contains_jpeg_formats(self):
         """Should map JPEG extensions to image/jpeg."""
-        from tasktriage.image import MEDIA_TYPE_MAP
-
         assert ".jpg" in MEDIA_TYPE_MAP
         assert MEDIA_TYPE_MAP[".jpg"] == "image/jpeg"
         assert ".jpeg" in MEDIA_TYPE_MAP
@@ -60,8 +59,6 @@ class TestMediaTypeMap:
 
     def test_media_type_map_contains_gif_and_webp(self):
         """Should map GIF and WebP extensions."""
-        from tasktriage.image import MEDIA_TYPE_MAP
-
         assert ".gif" in MEDIA_TYPE_MAP
         assert MEDIA_TYPE_MAP[".gif"] == "image/gif"
         assert ".webp" in MEDIA_TYPE_MAP
@@ -76,103 +73,73 @@ class TestExtractTextFromImage:
         """Create a mock LLM that returns extracted text."""
         with patch("tasktriage.image.ChatAnthropic") as mock_class:
             mock_instance = MagicMock()
-            mock_response = MagicMock()
-            mock_response.content = """Work
+            # Only .content is read from the response
+            mock_instance.invoke.return_value = SimpleNamespace(content="""Work
     Review budget proposal
     Fix login bug *
 
 Home
     Grocery shopping
-"""
-            mock_instance.invoke.return_value = mock_response
+""")
             mock_class.return_value = mock_instance
             yield mock_class, mock_instance
 
-    @pytest.fixture
-    def png_file(self, temp_dir):
-        """Create a minimal valid PNG file."""
-        png_path = temp_dir / "test_notes.png"
-        # Minimal valid 1x1 PNG
-        png_data = bytes([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,
-            0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
-            0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01,
-            0x08, 0x02, 0x00, 0x00, 0x00, 0x90, 0x77, 0x53,
-            0xDE, 0x00, 0x00, 0x00, 0x0C, 0x49, 0x44, 0x41,
-            0x54, 0x08, 0xD7, 0x63, 0xF8, 0xFF, 0xFF, 0x3F,
-            0x00, 0x05, 0xFE, 0x02, 0xFE, 0xDC, 0xCC, 0x59,
-            0xE7, 0x00, 0x00, 0x00, 0x00, 0x49, 0x45, 0x4E,
-            0x44, 0xAE, 0x42, 0x60, 0x82
-        ])
-        png_path.write_bytes(png_data)
-        return png_path
-
-    def test_extracts_text_from_png(self, mock_llm, png_file):
+    def test_extracts_text_from_png(self, mock_llm, minimal_png_file):
         """Should extract text from a PNG image using Claude's vision API."""
         mock_class, mock_instance = mock_llm
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image
-
-            result = extract_text_from_image(png_file)
+            result = extract_text_from_image(minimal_png_file)
 
             assert "Work" in result
             assert "Review budget proposal" in result
             mock_instance.invoke.assert_called_once()
 
-    def test_uses_provided_api_key(self, mock_llm, png_file):
+    def test_uses_provided_api_key(self, mock_llm, minimal_png_file):
         """Should use the provided API key."""
         mock_class, mock_instance = mock_llm
 
         with patch("tasktriage.image.fetch_api_key") as mock_fetch, \
              patch("tasktriage.image.load_model_config", return_value={}):
             mock_fetch.return_value = "custom-api-key"
-            from tasktriage.image import extract_text_from_image
-
-            extract_text_from_image(png_file, api_key="custom-api-key")
+            extract_text_from_image(minimal_png_file, api_key="custom-api-key")
 
             mock_fetch.assert_called_with("custom-api-key")
 
-    def test_uses_default_model_when_not_configured(self, mock_llm, png_file):
+    def test_uses_default_model_when_not_configured(self, mock_llm, minimal_png_file):
         """Should use default model when not specified in config."""
         mock_class, mock_instance = mock_llm
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image, DEFAULT_MODEL
-
-            extract_text_from_image(png_file)
+            extract_text_from_image(minimal_png_file)
 
             # Verify ChatAnthropic was called with default model
             mock_class.assert_called_once()
             call_kwargs = mock_class.call_args[1]
             assert call_kwargs["model"] == DEFAULT_MODEL
 
-    def test_uses_model_from_config(self, mock_llm, png_file):
+    def test_uses_model_from_config(self, mock_llm, minimal_png_file):
         """Should use model specified in config."""
         mock_class, mock_instance = mock_llm
         config = {"model": "claude-sonnet-4-20250514", "temperature": 0.5}
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value=config.copy()):
-            from tasktriage.image import extract_text_from_image
-
-            extract_text_from_image(png_file)
+            extract_text_from_image(minimal_png_file)
 
             mock_class.assert_called_once()
             call_kwargs = mock_class.call_args[1]
             assert call_kwargs["model"] == "claude-sonnet-4-20250514"
 
-    def test_encodes_image_as_base64(self, mock_llm, png_file):
+    def test_encodes_image_as_base64(self, mock_llm, minimal_png_file):
         """Should encode image content as base64."""
         mock_class, mock_instance = mock_llm
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image
-
-            extract_text_from_image(png_file)
+            extract_text_from_image(minimal_png_file)
 
             # Check that invoke was called with image data
             call_args = mock_instance.invoke.call_args[0][0]
@@ -184,17 +151,69 @@ Home
             image_content = message.content[1]
             assert image_content["type"] == "image_url"
             assert "data:image/png;base64," in image_content["image_url"]["url"]
+            expected = base64.standard_b64encode(minimal_png_file.read_bytes()).decode("ascii")
+            assert image_content["image_url"]["url"] == f"data:image/png;base64,{expected}"
 
-    def test_includes_extraction_prompt(self, mock_llm, png_file):
-        """Should include the image extraction prompt in the message."""
+    def test_large_image_is_downscaled(self, mock_llm, temp_dir, monkeypatch):
+        """Images larger than IMAGE_MAX_DIMENSION should be resized to fit before upload."""
         mock_class, mock_instance = mock_llm
+        monkeypatch.setattr("tasktriage.image.IMAGE_MAX_DIMENSION", 64)
+        large_png = temp_dir / "large_notes.png"
+        Image.new("RGB", (256, 128), "white").save(large_png)
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image, IMAGE_EXTRACTION_PROMPT
-            from tasktriage.prompts import IMAGE_EXTRACTION_PROMPT
+            extract_text_from_image(large_png)
+
+        message = mock_instance.invoke.call_args[0][0][0]
+        url = message.content[1]["image_url"]["url"]
+        encoded = url.removeprefix("data:image/png;base64,")
+        with Image.open(io.BytesIO(base64.b64decode(encoded))) as sent:
+            assert sent.format == "PNG"
+            assert sent.size == (64, 32)
 
-            extract_text_from_image(png_file)
+    def test_truncated_large_image_is_sent_as_is(self, mock_llm, temp_dir, monkeypatch):
+        """A partly synced oversized image should be sent unchanged instead of failing."""
+        mock_class, mock_instance = mock_llm
+        monkeypatch.setattr("tasktriage.image.IMAGE_MAX_DIMENSION", 64)
+        buffer = io.BytesIO()
+        Image.effect_noise((256, 128), 64).save(buffer, format="PNG")
+        truncated_png = temp_dir / "truncated_notes.png"
+        truncated_png.write_bytes(buffer.getvalue()[:len(buffer.getvalue()) // 2])
+
+        with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
+             patch("tasktriage.image.load_model_config", return_value={}):
+            extract_text_from_image(truncated_png)
+
+        message = mock_instance.invoke.call_args[0][0][0]
+        expected = base64.standard_b64encode(truncated_png.read_bytes()).decode("ascii")
+        assert message.content[1]["image_url"]["url"] == f"data:image/png;base64,{expected}"
+
+    def test_rotated_photo_is_sent_upright(self, mock_llm, temp_dir):
+        """A JPEG with an EXIF rotation should be turned upright before re-encoding drops the tag."""
+        mock_class, mock_instance = mock_llm
+        photo = temp_dir / "rotated_notes.jpg"
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotate 90 degrees clockwise to display
+        Image.new("RGB", (40, 20), "white").save(photo, exif=exif)
+
+        with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
+             patch("tasktriage.image.load_model_config", return_value={}):
+            extract_text_from_image(photo)
+
+        message = mock_instance.invoke.call_args[0][0][0]
+        encoded = message.content[1]["image_url"]["url"].removeprefix("data:image/jpeg;base64,")
+        with Image.open(io.BytesIO(base64.b64decode(encoded))) as sent:
+            assert sent.format == "JPEG"
+            assert sent.size == (20, 40)
+
+    def test_includes_extraction_prompt(self, mock_llm, minimal_png_file):
+        """Should include the image extraction prompt in the message."""
+        mock_class, mock_instance = mock_llm
+
+        with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
+             patch("tasktriage.image.load_model_config", return_value={}):
+            extract_text_from_image(minimal_png_file)
 
             call_args = mock_instance.invoke.call_args[0][0]
             message = call_args[0]
@@ -202,15 +221,13 @@ Home
             assert text_content["type"] == "text"
             assert text_content["text"] == IMAGE_EXTRACTION_PROMPT
 
-    def test_returns_response_content(self, mock_llm, png_file):
+    def test_returns_response_content(self, mock_llm, minimal_png_file):
         """Should return the content from the LLM response."""
         mock_class, mock_instance = mock_llm
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image
-
-            result = extract_text_from_image(png_file)
+            result = extract_text_from_image(minimal_png_file)
 
             # Result should match the mock response content
             assert "Work" in result
@@ -220,24 +237,20 @@ Home
         """Should raise ValueError for unsupported image formats."""
         # Create a file with unsupported extension
         unsupported_file = temp_dir / "test_notes.bmp"
-        unsupported_file.write_bytes(b"fake image data")
+        unsupported_file.touch()
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image
-
             with pytest.raises(ValueError, match="Unsupported image format"):
                 extract_text_from_image(unsupported_file)
 
     def test_error_message_lists_supported_formats(self, temp_dir):
         """Error message should list supported image formats."""
         unsupported_file = temp_dir / "test_notes.tiff"
-        unsupported_file.write_bytes(b"fake image data")
+        unsupported_file.touch()
 
         with patch("tasktriage.image.fetch_api_key", return_value="test-key"), \
              patch("tasktriage.image.load_model_config", return_value={}):
-            from tasktriage.image import extract_text_from_image
-
             with pytest.raises(ValueError) as exc_info:
                 extract_text_from_image(unsupported_file)
 
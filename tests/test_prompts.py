@@ -5,218 +5,176 @@ Tests for tasktriage.prompts module.
 import pytest
 from langchain_core.prompts import ChatPromptTemplate
 
+from tasktriage.prompts import (
+    DAILY_HUMAN_PROMPT,
+    DAILY_SYSTEM_PROMPT,
+    IMAGE_EXTRACTION_PROMPT,
+    MONTHLY_HUMAN_PROMPT,
+    MONTHLY_SYSTEM_PROMPT,
+    WEEKLY_HUMAN_PROMPT,
+    WEEKLY_SYSTEM_PROMPT,
+    get_annual_prompt,
+    get_daily_prompt,
+    get_monthly_prompt,
+    get_weekly_prompt,
+)
+
+# Variables each analysis template expects to be formatted with
+DAILY_INPUT_VARS = frozenset({"current_date", "task_notes"})
+WEEKLY_INPUT_VARS = frozenset({"week_start", "week_end", "task_notes"})
+MONTHLY_INPUT_VARS = frozenset({"month_start", "month_end", "task_notes"})
+
+# Lowercased once for the case-insensitive content checks
+_DAILY_SYSTEM_LOWER = DAILY_SYSTEM_PROMPT.lower()
+_WEEKLY_SYSTEM_LOWER = WEEKLY_SYSTEM_PROMPT.lower()
+_MONTHLY_SYSTEM_LOWER = MONTHLY_SYSTEM_PROMPT.lower()
+_IMAGE_EXTRACTION_LOWER = IMAGE_EXTRACTION_PROMPT.lower()
+
 
 class TestDailyPrompt:
     """Tests for daily prompt template."""
 
-    def test_get_daily_prompt_returns_chat_prompt_template(self):
+    def test_get_daily_prompt_returns_chat_prompt_template(self, daily_prompt):
         """Should return a ChatPromptTemplate instance."""
-        from tasktriage.prompts import get_daily_prompt
-
-        result = get_daily_prompt()
-        assert isinstance(result, ChatPromptTemplate)
+        assert isinstance(daily_prompt, ChatPromptTemplate)
 
-    def test_daily_prompt_has_required_input_variables(self):
+    def test_daily_prompt_has_required_input_variables(self, daily_prompt):
         """Should have current_date and task_notes as input variables."""
-        from tasktriage.prompts import get_daily_prompt
-
-        prompt = get_daily_prompt()
-        assert "current_date" in prompt.input_variables
-        assert "task_notes" in prompt.input_variables
+        assert DAILY_INPUT_VARS <= set(daily_prompt.input_variables)
 
-    def test_daily_prompt_can_be_formatted(self):
+    def test_daily_prompt_can_be_formatted(self, daily_prompt, sample_daily_notes):
         """Should format correctly with provided variables."""
-        from tasktriage.prompts import get_daily_prompt
-
-        prompt = get_daily_prompt()
-        messages = prompt.format_messages(
+        messages = daily_prompt.format_messages(
             current_date="Monday, December 30, 2024",
-            task_notes="Work\n    Task 1\n    Task 2"
+            task_notes=sample_daily_notes
         )
 
         assert len(messages) == 2
-        assert "Monday, December 30, 2024" in messages[0].content
-        assert "Task 1" in messages[1].content
+        system_text, human_text = messages[0].content, messages[1].content
+        assert "Monday, December 30, 2024" in system_text
+        assert "Task 1" in human_text
 
 
 class TestWeeklyPrompt:
     """Tests for weekly prompt template."""
 
-    def test_get_weekly_prompt_returns_chat_prompt_template(self):
+    def test_get_weekly_prompt_returns_chat_prompt_template(self, weekly_prompt):
         """Should return a ChatPromptTemplate instance."""
-        from tasktriage.prompts import get_weekly_prompt
-
-        result = get_weekly_prompt()
-        assert isinstance(result, ChatPromptTemplate)
+        assert isinstance(weekly_prompt, ChatPromptTemplate)
 
-    def test_weekly_prompt_has_required_input_variables(self):
+    def test_weekly_prompt_has_required_input_variables(self, weekly_prompt):
         """Should have week_start, week_end, and task_notes as input variables."""
-        from tasktriage.prompts import get_weekly_prompt
+        assert WEEKLY_INPUT_VARS <= set(weekly_prompt.input_variables)
 
-        prompt = get_weekly_prompt()
-        assert "week_start" in prompt.input_variables
-        assert "week_end" in prompt.input_variables
-        assert "task_notes" in prompt.input_variables
-
-    def test_weekly_prompt_can_be_formatted(self):
+    def test_weekly_prompt_can_be_formatted(self, weekly_prompt, sample_weekly_notes):
         """Should format correctly with provided variables."""
-        from tasktriage.prompts import get_weekly_prompt
-
-        prompt = get_weekly_prompt()
-        messages = prompt.format_messages(
+        messages = weekly_prompt.format_messages(
             week_start="Monday, December 23, 2024",
             week_end="Sunday, December 29, 2024",
-            task_notes="## Monday\n\nTask analysis..."
+            task_notes=sample_weekly_notes
         )
 
         assert len(messages) == 2
-        assert "December 23, 2024" in messages[0].content
-        assert "December 29, 2024" in messages[0].content
-        assert "Task analysis" in messages[1].content
+        system_text, human_text = messages[0].content, messages[1].content
+        assert "December 23, 2024" in system_text
+        assert "December 29, 2024" in system_text
+        assert "Task analysis" in human_text
+
+    def test_weekly_prompt_partial_matches_full_format(self, weekly_prompt, sample_weekly_notes):
+        """Binding the dates with partial() should render the same messages as formatting at once."""
+        dates = {"week_start": "Monday, December 23, 2024", "week_end": "Sunday, December 29, 2024"}
+
+        bound = weekly_prompt.partial(**dates)
+
+        assert bound.input_variables == ["task_notes"]
+        assert bound.format_messages(task_notes=sample_weekly_notes) == weekly_prompt.format_messages(
+            task_notes=sample_weekly_notes, **dates
+        )
 
 
 class TestMonthlyPrompt:
     """Tests for monthly prompt template."""
 
-    def test_get_monthly_prompt_returns_chat_prompt_template(self):
+    def test_get_monthly_prompt_returns_chat_prompt_template(self, monthly_prompt):
         """Should return a ChatPromptTemplate instance."""
-        from tasktriage.prompts import get_monthly_prompt
-
-        result = get_monthly_prompt()
-        assert isinstance(result, ChatPromptTemplate)
+        assert isinstance(monthly_prompt, ChatPromptTemplate)
 
-    def test_monthly_prompt_has_required_input_variables(self):
+    def test_monthly_prompt_has_required_input_variables(self, monthly_prompt):
         """Should have month_start, month_end, and task_notes as input variables."""
-        from tasktriage.prompts import get_monthly_prompt
-
-        prompt = get_monthly_prompt()
-        assert "month_start" in prompt.input_variables
-        assert "month_end" in prompt.input_variables
-        assert "task_notes" in prompt.input_variables
+        assert MONTHLY_INPUT_VARS <= set(monthly_prompt.input_variables)
 
-    def test_monthly_prompt_can_be_formatted(self):
+    def test_monthly_prompt_can_be_formatted(self, monthly_prompt, sample_monthly_notes):
         """Should format correctly with provided variables."""
-        from tasktriage.prompts import get_monthly_prompt
-
-        prompt = get_monthly_prompt()
-        messages = prompt.format_messages(
+        messages = monthly_prompt.format_messages(
             month_start="December 1, 2024",
             month_end="December 31, 2024",
-            task_notes="## Week 1\n\nWeekly analysis..."
+            task_notes=sample_monthly_notes
         )
 
         assert len(messages) == 2
-        assert "December 1, 2024" in messages[0].content
-        assert "December 31, 2024" in messages[0].content
-        assert "Weekly analysis" in messages[1].content
+        system_text, human_text = messages[0].content, messages[1].content
+        assert "December 1, 2024" in system_text
+        assert "December 31, 2024" in system_text
+        assert "Weekly analysis" in human_text
 
 
 class TestPromptConstants:
     """Tests for prompt string constants."""
 
-    def test_daily_system_prompt_exists_and_not_empty(self):
-        """DAILY_SYSTEM_PROMPT should exist and contain content."""
-        from tasktriage.prompts import DAILY_SYSTEM_PROMPT
-
-        assert DAILY_SYSTEM_PROMPT is not None
-        assert len(DAILY_SYSTEM_PROMPT) > 100
-        assert "GTD" in DAILY_SYSTEM_PROMPT
-
-    def test_daily_human_prompt_exists_and_not_empty(self):
-        """DAILY_HUMAN_PROMPT should exist and contain task_notes placeholder."""
-        from tasktriage.prompts import DAILY_HUMAN_PROMPT
-
-        assert DAILY_HUMAN_PROMPT is not None
-        assert "{task_notes}" in DAILY_HUMAN_PROMPT
-
-    def test_weekly_system_prompt_exists_and_not_empty(self):
-        """WEEKLY_SYSTEM_PROMPT should exist and contain content."""
-        from tasktriage.prompts import WEEKLY_SYSTEM_PROMPT
-
-        assert WEEKLY_SYSTEM_PROMPT is not None
-        assert len(WEEKLY_SYSTEM_PROMPT) > 100
-        assert "week" in WEEKLY_SYSTEM_PROMPT.lower()
-
-    def test_weekly_human_prompt_exists_and_not_empty(self):
-        """WEEKLY_HUMAN_PROMPT should exist and contain task_notes placeholder."""
-        from tasktriage.prompts import WEEKLY_HUMAN_PROMPT
-
-        assert WEEKLY_HUMAN_PROMPT is not None
-        assert "{task_notes}" in WEEKLY_HUMAN_PROMPT
-
-    def test_monthly_system_prompt_exists_and_not_empty(self):
-        """MONTHLY_SYSTEM_PROMPT should exist and contain content."""
-        from tasktriage.prompts import MONTHLY_SYSTEM_PROMPT
-
-        assert MONTHLY_SYSTEM_PROMPT is not None
-        assert len(MONTHLY_SYSTEM_PROMPT) > 100
-        assert "month" in MONTHLY_SYSTEM_PROMPT.lower()
-
-    def test_monthly_human_prompt_exists_and_not_empty(self):
-        """MONTHLY_HUMAN_PROMPT should exist and contain task_notes placeholder."""
-        from tasktriage.prompts import MONTHLY_HUMAN_PROMPT
-
-        assert MONTHLY_HUMAN_PROMPT is not None
-        assert "{task_notes}" in MONTHLY_HUMAN_PROMPT
-
-    def test_image_extraction_prompt_exists_and_not_empty(self):
-        """IMAGE_EXTRACTION_PROMPT should exist and contain extraction instructions."""
-        from tasktriage.prompts import IMAGE_EXTRACTION_PROMPT
-
-        assert IMAGE_EXTRACTION_PROMPT is not None
-        assert len(IMAGE_EXTRACTION_PROMPT) > 50
-        assert "extract" in IMAGE_EXTRACTION_PROMPT.lower() or "text" in IMAGE_EXTRACTION_PROMPT.lower()
+    @pytest.mark.parametrize(
+        "prompt_text, min_length, needle",
+        [
+            pytest.param(DAILY_SYSTEM_PROMPT, 100, "GTD", id="daily-system"),
+            pytest.param(DAILY_HUMAN_PROMPT, 0, "{task_notes}", id="daily-human"),
+            pytest.param(WEEKLY_SYSTEM_PROMPT, 100, "week", id="weekly-system"),
+            pytest.param(WEEKLY_HUMAN_PROMPT, 0, "{task_notes}", id="weekly-human"),
+            pytest.param(MONTHLY_SYSTEM_PROMPT, 100, "month", id="monthly-system"),
+            pytest.param(MONTHLY_HUMAN_PROMPT, 0, "{task_notes}", id="monthly-human"),
+            pytest.param(IMAGE_EXTRACTION_PROMPT, 50, "extract", id="image-extraction"),
+        ],
+    )
+    def test_prompt_constant_exists_and_not_empty(self, prompt_text, min_length, needle):
+        """Prompt constants should have content and mention their key term or placeholder."""
+        assert len(prompt_text) > min_length
+        assert needle.lower() in prompt_text.lower()
 
 
 class TestPromptContent:
     """Tests for prompt content quality."""
 
-    def test_daily_prompt_includes_priority_guidance(self):
-        """Daily prompt should include task prioritization guidance."""
-        from tasktriage.prompts import DAILY_SYSTEM_PROMPT
-
-        # Check for priority-related content
-        content_lower = DAILY_SYSTEM_PROMPT.lower()
-        assert "priority" in content_lower or "urgent" in content_lower
-
-    def test_daily_prompt_includes_time_estimates(self):
-        """Daily prompt should mention time estimates."""
-        from tasktriage.prompts import DAILY_SYSTEM_PROMPT
-
-        content_lower = DAILY_SYSTEM_PROMPT.lower()
-        assert "time" in content_lower or "minute" in content_lower or "hour" in content_lower
-
-    def test_daily_prompt_includes_energy_levels(self):
-        """Daily prompt should mention energy levels."""
-        from tasktriage.prompts import DAILY_SYSTEM_PROMPT
-
-        content_lower = DAILY_SYSTEM_PROMPT.lower()
-        assert "energy" in content_lower
-
-    def test_weekly_prompt_includes_pattern_analysis(self):
-        """Weekly prompt should include pattern analysis guidance."""
-        from tasktriage.prompts import WEEKLY_SYSTEM_PROMPT
-
-        content_lower = WEEKLY_SYSTEM_PROMPT.lower()
-        assert "pattern" in content_lower or "behavior" in content_lower
-
-    def test_image_extraction_prompt_preserves_structure(self):
-        """Image extraction prompt should mention preserving structure."""
-        from tasktriage.prompts import IMAGE_EXTRACTION_PROMPT
-
-        content_lower = IMAGE_EXTRACTION_PROMPT.lower()
-        assert "structure" in content_lower or "format" in content_lower
-
-    def test_monthly_prompt_includes_strategic_analysis(self):
-        """Monthly prompt should include strategic analysis guidance."""
-        from tasktriage.prompts import MONTHLY_SYSTEM_PROMPT
-
-        content_lower = MONTHLY_SYSTEM_PROMPT.lower()
-        assert "strategic" in content_lower or "achievement" in content_lower
-
-    def test_monthly_prompt_includes_systemic_patterns(self):
-        """Monthly prompt should mention systemic patterns and trends."""
-        from tasktriage.prompts import MONTHLY_SYSTEM_PROMPT
-
-        content_lower = MONTHLY_SYSTEM_PROMPT.lower()
-        assert "pattern" in content_lower or "trend" in content_lower
+    @pytest.mark.parametrize(
+        "content_lower, keywords",
+        [
+            pytest.param(_DAILY_SYSTEM_LOWER, ("priority", "urgent"), id="daily-priority"),
+            pytest.param(_DAILY_SYSTEM_LOWER, ("time", "minute", "hour"), id="daily-time-estimates"),
+            pytest.param(_DAILY_SYSTEM_LOWER, ("energy",), id="daily-energy-levels"),
+            pytest.param(_WEEKLY_SYSTEM_LOWER, ("pattern", "behavior"), id="weekly-pattern-analysis"),
+            pytest.param(_IMAGE_EXTRACTION_LOWER, ("structure", "format"), id="image-preserves-structure"),
+            pytest.param(_MONTHLY_SYSTEM_LOWER, ("strategic", "achievement"), id="monthly-strategic-analysis"),
+            pytest.param(_MONTHLY_SYSTEM_LOWER, ("pattern", "trend"), id="monthly-systemic-patterns"),
+        ],
+    )
+    def test_prompt_includes_guidance(self, content_lower, keywords):
+        """Prompts should mention at least one keyword for each piece of guidance."""
+        assert any(keyword in content_lower for keyword in keywords)
+
+
+class TestPromptCaching:
+    """Tests for prompt template memoization."""
+
+    @pytest.mark.parametrize(
+        "get_prompt",
+        [get_daily_prompt, get_weekly_prompt, get_monthly_prompt, get_annual_prompt],
+        ids=["daily", "weekly", "monthly", "annual"],
+    )
+    def test_prompt_template_is_built_once(self, get_prompt):
+        """Repeated calls should return the same cached template."""
+        assert get_prompt() is get_prompt()
+
+    def test_cached_template_formats_consistently(self, daily_prompt):
+        """Formatting the shared template should not leave state behind for later callers."""
+        first = daily_prompt.format_messages(current_date="Monday, December 30, 2024", task_notes="Task 1")
+        daily_prompt.format_messages(current_date="Tuesday, December 31, 2024", task_notes="Task 2")
+        again = daily_prompt.format_messages(current_date="Monday, December 30, 2024", task_notes="Task 1")
+
+        assert again == first